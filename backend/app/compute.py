@@ -0,0 +1,45 @@
+"""
+Executor for the CPU-bound part of request handling.
+
+Cheap lookups (precomputed analyses, catalog listings) run directly in async
+handlers. Anything that ranks neighbours, builds analyses or fuzzy-matches
+titles goes through run_compute(), which hands it to a dedicated pool
+instead of FastAPI's shared threadpool, so a burst of cache misses cannot
+starve other requests of threads.
+
+    COMPUTE_EXECUTOR=thread   ThreadPoolExecutor (default; NumPy releases the GIL)
+    COMPUTE_EXECUTOR=process  ProcessPoolExecutor; each worker warms its own catalog
+    COMPUTE_EXECUTOR=inline   run on the event loop (for debugging and benchmarks)
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+
+def create_executor(kind: str, workers: int, initializer: Callable = None) -> Optional[Executor]:
+    """Pool for compute work; None for inline execution"""
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(f"COMPUTE_EXECUTOR must be {', '.join(EXECUTOR_KINDS)}, not '{kind}'")
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="compute")
+    if kind == "process":
+        # spawn, not fork: the parent runs threads (warm-up, the thread pool)
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer
+        )
+    return None
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+async def run_compute(executor: Optional[Executor], func: Callable, *args):
+    """Run func(*args) on the executor (inline when there is none) and await the result"""
+    if executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
@@ -1,24 +1,188 @@
 import json
-import pandas as pd
+import hashlib
+import numpy as np
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from app.occupations import OccupationIndex
+from app.records import JobRecord
+from app.snapshot import snapshot_path, read_snapshot, write_snapshot
+from app.search import TitleIndex
+
+# Doom tiers: high above 60, medium above 35, low at or below 35
+HIGH_RISK_THRESHOLD = 60.0
+MEDIUM_RISK_THRESHOLD = 35.0
+RISK_TIERS = ("high", "medium", "low")
+
+# Orderings accepted by DataLoader.query_jobs
+JOB_SORTS = ("catalog", "title", "risk", "-risk")
+
+def get_risk_tier(risk_score: float) -> str:
+    """Map a risk score to its doom tier"""
+    if risk_score > HIGH_RISK_THRESHOLD:
+        return "high"
+    elif risk_score > MEDIUM_RISK_THRESHOLD:
+        return "medium"
+    return "low"
+
+def validate_jobs(jobs: Dict) -> None:
+    """Check the catalog schema once at load time"""
+    if not isinstance(jobs, dict) or not jobs:
+        raise ValueError("Job catalog must be a non-empty object keyed by job")
+
+    vector_length = None
+    for key, job in jobs.items():
+        for field in ("title", "onet_code"):
+            if not isinstance(job.get(field), str):
+                raise ValueError(f"Job '{key}' is missing '{field}'")
+
+        risk_score = job.get("risk_score")
+        if not isinstance(risk_score, (int, float)) or not 0 <= risk_score <= 100:
+            raise ValueError(f"Job '{key}' has an invalid risk_score")
+
+        tasks = job.get("tasks")
+        if not isinstance(tasks, dict):
+            raise ValueError(f"Job '{key}' is missing 'tasks'")
+        string_lists = {
+            "skills": job.get("skills"),
+            "tech_threats": job.get("tech_threats"),
+            "tasks.automatable": tasks.get("automatable"),
+            "tasks.human_required": tasks.get("human_required"),
+        }
+        for field, values in string_lists.items():
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                raise ValueError(f"Job '{key}' has an invalid '{field}' list")
+        alternate_titles = job.get("alternate_titles", [])
+        if not isinstance(alternate_titles, list) or not all(isinstance(v, str) for v in alternate_titles):
+            raise ValueError(f"Job '{key}' has an invalid 'alternate_titles' list")
+        employment = job.get("employment")
+        if employment is not None and (isinstance(employment, bool) or not isinstance(employment, int) or employment < 0):
+            raise ValueError(f"Job '{key}' has an invalid employment count")
+        if not tasks["automatable"] and not tasks["human_required"]:
+            raise ValueError(f"Job '{key}' has no tasks")
+
+        vector = job.get("skill_vector")
+        if not isinstance(vector, list) or not all(isinstance(v, (int, float)) for v in vector):
+            raise ValueError(f"Job '{key}' has an invalid skill_vector")
+        if vector_length is None:
+            vector_length = len(vector)
+        elif len(vector) != vector_length:
+            raise ValueError(f"Job '{key}' skill_vector length differs from the catalog")
 
 class DataLoader:
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", use_snapshot: bool = False, fuzzy_threshold: float = 0.8):
         self.data_dir = Path(data_dir)
+        self.use_snapshot = use_snapshot
+        self.fuzzy_threshold = fuzzy_threshold
         self.jobs_data = None
+        self.records = []
+        self.risk_scores = None
+        self.risk_order = None
+        self.risk_order_desc = None
+        self.sorted_risks = None
+        self.tier_slices = {}
+        self.title_ranks = None
+        self.skill_vectors = None
+        self.skill_vocab = []
+        self.skill_ids = {}
+        self.skill_matrix = None
+        self.content_hash = None
+        self.source = None
+        self.stats = None
+        self.title_index = None
+        self.occupation_index = None
         self.load_data()
 
     def load_data(self):
         """Load and cache normalized job data"""
-        # Always use the latest data from code (for now)
-        # TODO: Switch to loading from file when we have real data pipeline
-        self.jobs_data = self._create_sample_data()
-        
-        # Optionally save for reference
-        # processed_path = self.data_dir / "processed" / "jobs_normalized.json"
-        # if not processed_path.exists():
-        #     self._save_processed_data()
+        processed_path = self.data_dir / "processed" / "jobs_normalized.json"
+
+        if processed_path.exists():
+            jobs = self._load_processed_data(processed_path)
+        else:
+            # No processed catalog on disk: fall back to the built-in sample data
+            jobs = self._create_sample_data()
+            self.content_hash = hashlib.sha256(json.dumps(jobs).encode("utf-8")).hexdigest()[:16]
+            self.source = "sample"
+
+        # Global skill vocabulary, in order of first appearance
+        self.skill_ids = {}
+        for job in jobs.values():
+            for skill in job["skills"]:
+                self.skill_ids.setdefault(skill, len(self.skill_ids))
+        self.skill_vocab = list(self.skill_ids)
+
+        # Typed records plus struct-of-arrays columns in catalog order
+        self.records = [
+            JobRecord.from_dict(key, index, job, self.skill_ids)
+            for index, (key, job) in enumerate(jobs.items())
+        ]
+        self.jobs_data = {record.key: record for record in self.records}
+        self.risk_scores = np.array([record.risk_score for record in self.records], dtype=np.float64)
+        self.skill_vectors = np.array([record.skill_vector for record in self.records], dtype=np.float64)
+
+        # Row per job, column per vocabulary skill
+        self.skill_matrix = np.zeros((len(self.records), len(self.skill_vocab)), dtype=bool)
+        for record in self.records:
+            self.skill_matrix[record.index, [self.skill_ids[skill] for skill in record.skills]] = True
+
+        self._build_risk_index()
+        self.title_index = TitleIndex(self.records)
+        self.occupation_index = OccupationIndex(
+            self.records, self.risk_scores, [get_risk_tier(record.risk_score) for record in self.records]
+        )
+        self.stats = self._compute_stats()
+
+    def _build_risk_index(self):
+        """Rows sorted by risk, so range and tier queries are two binary searches"""
+        rows = np.arange(len(self.records))
+        # Ties keep catalog order in both directions
+        self.risk_order = np.lexsort((rows, self.risk_scores))
+        self.risk_order_desc = np.lexsort((rows, -self.risk_scores))
+        self.sorted_risks = self.risk_scores[self.risk_order]
+
+        # Each tier is a contiguous (start, stop) slice of risk_order
+        medium_start = int(np.searchsorted(self.sorted_risks, MEDIUM_RISK_THRESHOLD, side="right"))
+        high_start = int(np.searchsorted(self.sorted_risks, HIGH_RISK_THRESHOLD, side="right"))
+        self.tier_slices = {
+            "low": (0, medium_start),
+            "medium": (medium_start, high_start),
+            "high": (high_start, len(self.records)),
+        }
+
+        # Position of each row in case-insensitive title order
+        self.title_ranks = np.empty(len(self.records), dtype=np.int64)
+        by_title = sorted(rows, key=lambda row: (self.records[row].title.lower(), row))
+        self.title_ranks[by_title] = rows
+
+    def _load_processed_data(self, processed_path: Path) -> Dict:
+        """Load the processed catalog, preferring a compiled snapshot"""
+        raw = processed_path.read_bytes()
+        self.content_hash = hashlib.sha256(raw).hexdigest()[:16]
+
+        cache_path = snapshot_path(self.data_dir / "cache", processed_path.stem, self.content_hash)
+        if self.use_snapshot and cache_path.exists():
+            try:
+                jobs = read_snapshot(cache_path)
+                self.source = "snapshot"
+                return jobs
+            except (OSError, ValueError, KeyError):
+                pass  # Unreadable or stale layout: rebuild from JSON below
+
+        jobs = json.loads(raw)
+        validate_jobs(jobs)
+        self.source = "json"
+
+        if self.use_snapshot:
+            try:
+                write_snapshot(cache_path, jobs)
+                # Snapshots of older catalog versions are never read again
+                for stale_path in cache_path.parent.glob(f"{processed_path.stem}.*.npz"):
+                    if stale_path != cache_path:
+                        stale_path.unlink()
+            except OSError:
+                pass  # Read-only filesystem: keep serving from JSON
+
+        return jobs
 
     def _create_sample_data(self) -> Dict:
 
@@ -613,34 +777,109 @@ class DataLoader:
         }
     }
 
+    def _compute_stats(self) -> Dict:
+        """Aggregate risk statistics for the Humanity Doom Index"""
+        jobs = self.records
+        ranked = [jobs[row] for row in self.risk_order_desc]
+        tier_counts = {tier: stop - start for tier, (start, stop) in self.tier_slices.items()}
+
+        return {
+            "job_count": len(jobs),
+            "average_risk": round(float(self.risk_scores.mean()), 1) if jobs else 0.0,
+            "tier_counts": tier_counts,
+            "ranked_jobs": [
+                {
+                    "job_title": job.title,
+                    "risk_score": round(job.risk_score, 1),
+                    "tier": get_risk_tier(job.risk_score)
+                }
+                for job in ranked
+            ]
+        }
+
     def _save_processed_data(self):
         """Save processed data to JSON"""
         processed_path = self.data_dir / "processed"
         processed_path.mkdir(parents=True, exist_ok=True)
 
         with open(processed_path / "jobs_normalized.json", 'w') as f:
-            json.dump(self.jobs_data, indent=2, fp=f)
+            json.dump({key: record.to_dict() for key, record in self.jobs_data.items()}, indent=2, fp=f)
 
-    def get_job(self, job_key: str) -> Dict:
+    def get_job(self, job_key: str) -> Optional[JobRecord]:
         """Get job data by normalized key"""
         return self.jobs_data.get(job_key)
 
-    def search_job(self, title: str) -> Dict:
-        """Fuzzy search for job by title"""
-        title_lower = title.lower().replace(" ", "_")
+    def find_job_key(self, title: str, fuzzy: bool = True) -> Optional[str]:
+        """Resolve a typed title to its job key.
+
+        With ``fuzzy=False`` only the direct and index lookups run; the
+        typo-tolerant fallback costs edit distances over a shortlist.
+        """
+        title_key = title.lower().replace(" ", "_")
 
         # Direct match
-        if title_lower in self.jobs_data:
-            return self.jobs_data[title_lower]
+        if title_key in self.jobs_data:
+            return title_key
+
+        # Best ranked title match
+        job_key = self.title_index.best_match(title)
+        if job_key or not fuzzy:
+            return job_key
+
+        return self.fuzzy_job_key(title)
+
+    def fuzzy_job_key(self, title: str) -> Optional[str]:
+        """Typo-tolerant match, only if it is close enough"""
+        matches = self.title_index.fuzzy_search(title, limit=1, threshold=self.fuzzy_threshold)
+        return matches[0][0] if matches else None
+
+    def search_job(self, title: str) -> Optional[JobRecord]:
+        """Search for job by title, returning the best match"""
+        job_key = self.find_job_key(title)
+        return self.jobs_data[job_key] if job_key else None
+
+    def suggest_titles(self, title: str, limit: int = 5, threshold: float = 0.5) -> List[str]:
+        """Closest catalog titles for a query that did not resolve"""
+        matches = self.title_index.fuzzy_search(title, limit=limit, threshold=threshold)
+        return [self.jobs_data[job_key].title for job_key, _ in matches]
+
+    def query_jobs(
+        self,
+        min_risk: Optional[float] = None,
+        max_risk: Optional[float] = None,
+        tier: Optional[str] = None,
+        sort: str = "catalog",
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[JobRecord], int]:
+        """One page of the jobs within a risk range and tier, plus the total match count"""
+        if sort not in JOB_SORTS:
+            raise ValueError(f"sort must be {', '.join(JOB_SORTS)}, not '{sort}'")
 
-        # Fuzzy matching
-        for key, job in self.jobs_data.items():
-            if title.lower() in job["title"].lower():
-                return job
+        # Matches are the slice [start, stop) of the ascending risk order
+        start, stop = 0, len(self.records)
+        if min_risk is not None:
+            start = int(np.searchsorted(self.sorted_risks, min_risk, side="left"))
+        if max_risk is not None:
+            stop = int(np.searchsorted(self.sorted_risks, max_risk, side="right"))
+        if tier is not None:
+            tier_start, tier_stop = self.tier_slices[tier]
+            start, stop = max(start, tier_start), min(stop, tier_stop)
+        total = max(stop - start, 0)
 
-        # Default fallback
-        return None
+        end = None if limit is None else offset + limit
+        if sort == "risk":
+            rows = self.risk_order[start:start + total][offset:end]
+        elif sort == "-risk":
+            # Same jobs, mirrored into the descending order
+            count = len(self.records)
+            rows = self.risk_order_desc[count - start - total:count - start][offset:end]
+        else:
+            rows = self.risk_order[start:start + total]
+            keys = rows if sort == "catalog" else self.title_ranks[rows]
+            rows = rows[np.argsort(keys, kind="stable")][offset:end]
+        return [self.records[row] for row in rows], total
 
-    def get_all_jobs(self) -> List[Dict]:
+    def get_all_jobs(self) -> List[JobRecord]:
         """Get all jobs for similarity comparison"""
-        return list(self.jobs_data.values())
+        return self.records
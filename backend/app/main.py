@@ -1,12 +1,39 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.models import JobRiskResponse, JobSearchRequest
-from app.data_loader import DataLoader
+from fastapi.responses import StreamingResponse
+from app.models import (
+    JobRiskResponse, JobSearchRequest, JobRiskSummary, JobBatchRequest, JobBatchResponse, StatsResponse,
+    SkillGapResponse, OccupationGroupsResponse, OccupationGroupDetail
+)
+from app.data_loader import JOB_SORTS, RISK_TIERS, DataLoader, get_risk_tier
 from app.similarity import JobSimilarityEngine
+from app.cache import LRUCache
+from app.precompute import SAFER_ROLES_COUNT, AnalysisTable, build_static_analysis, encode_payload, table_key
+from app.responses import FastJSONResponse, RawJSONResponse, dumps
+from app.occupations import SOC_LEVELS
+from app.compute import EXECUTOR_KINDS, create_executor, default_workers, run_compute
+from starlette.concurrency import run_in_threadpool
+import asyncio
 import random
+import hashlib
 import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so the port opens (and /health answers) at once;
+    # requests arriving before it finishes wait for it in wait_until_warm()
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    yield
+    if compute_executor is not None:
+        compute_executor.shutdown(wait=False, cancel_futures=True)
 
-app = FastAPI(title="Job Doom Calculator API", version="0.1.0")
+app = FastAPI(title="Job Doom Calculator API", version="0.1.0", default_response_class=FastJSONResponse, lifespan=lifespan)
 
 # CORS for frontend - configurable via environment
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:8501,http://127.0.0.1:8501").split(",")
@@ -19,9 +46,166 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize data
-data_loader = DataLoader()
-similarity_engine = JobSimilarityEngine(data_loader)
+# Compiled catalog snapshot: only faster than parsing JSON for large catalogs
+# (thousands of jobs), so off by default
+CATALOG_SNAPSHOT = os.getenv("CATALOG_SNAPSHOT", "0") == "1"
+
+# Typo-tolerance: scores run 0-1 (1 - edit distance / title length).
+# Matches at or above FUZZY_MATCH_THRESHOLD resolve automatically; the 404
+# path suggests titles at or above FUZZY_SUGGEST_THRESHOLD.
+FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.8"))
+FUZZY_SUGGEST_THRESHOLD = float(os.getenv("FUZZY_SUGGEST_THRESHOLD", "0.5"))
+
+# Flavor mode for automation_progress jitter and doom messages:
+#   "random" - fresh draw per request (default)
+#   "seeded" - derived from a hash of the job title, identical on every request
+#   "daily"  - like "seeded", but re-rolled once per UTC day
+FLAVOR_MODE = os.getenv("DOOM_FLAVOR_MODE", "random").lower()
+if FLAVOR_MODE not in ("random", "seeded", "daily"):
+    raise ValueError(f"DOOM_FLAVOR_MODE must be random, seeded or daily, not '{FLAVOR_MODE}'")
+
+# CPU-bound work (neighbour ranking, building analyses) runs on its own pool;
+# see app/compute.py
+COMPUTE_EXECUTOR = os.getenv("COMPUTE_EXECUTOR", "thread").lower()
+if COMPUTE_EXECUTOR not in EXECUTOR_KINDS:
+    raise ValueError(f"COMPUTE_EXECUTOR must be {', '.join(EXECUTOR_KINDS)}, not '{COMPUTE_EXECUTOR}'")
+COMPUTE_WORKERS = int(os.getenv("COMPUTE_WORKERS", "0")) or default_workers()
+# Handing work to the pool costs a thread hop and a GIL handoff (milliseconds
+# under load), while one table-backed analysis takes ~10us: tasks below this
+# many jobs (a few ms of work) run inline on the event loop
+COMPUTE_OFFLOAD_MIN_JOBS = int(os.getenv("COMPUTE_OFFLOAD_MIN_JOBS", "256"))
+
+# Jobs resolved per step of /analyze/stream; bounds the analyses held in memory
+# while the client reads, and how long one step keeps the event loop
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "64"))
+
+# Query parameter patterns for tier filters and /jobs ordering
+TIER_PATTERN = f"^({'|'.join(RISK_TIERS)})$"
+JOB_SORT_PATTERN = f"^({'|'.join(JOB_SORTS)})$"
+SOC_LEVEL_PATTERN = f"^({'|'.join(SOC_LEVELS)})$"
+
+# Catalog responses only change when the data does; clients revalidate via ETag
+CATALOG_CACHE_CONTROL = "public, max-age=300"
+
+# Catalog state, built once by warm_up() at startup (or by the first request
+# that needs it, when the app runs without its lifespan, e.g. in TestClient)
+data_loader = None
+similarity_engine = None
+# Supersedes the LRU cache while enabled: the options in the cache key do not
+# change the static payload
+analysis_table = None
+
+ready = False
+warm_up_seconds = None
+warm_up_error = None
+_warm_up_lock = threading.Lock()
+
+# Created on first use, so spawned process-pool workers never build their own
+compute_executor = None
+_executor_lock = threading.Lock()
+
+# Deterministic part of /analyze, keyed on (job key, experience, education)
+analysis_cache = LRUCache(
+    max_size=int(os.getenv("ANALYSIS_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("ANALYSIS_CACHE_TTL", "3600")) or None
+)
+
+def load_analysis_table(data_loader, similarity_engine):
+    """Precomputed analyses for the whole catalog, shared from disk when available"""
+    if os.getenv("PRECOMPUTE_ANALYSES", "1") == "0":
+        return None
+
+    table_path = os.getenv("PRECOMPUTED_ANALYSES_PATH")
+    if table_path:
+        table = AnalysisTable.load(Path(table_path), table_key(data_loader, similarity_engine), serialize=True)
+        if table is not None:
+            return table
+
+    table = AnalysisTable.build(data_loader, similarity_engine, serialize=True)
+    if table_path:
+        try:
+            table.save(Path(table_path))
+        except OSError:
+            pass  # Read-only filesystem: this process keeps its own copy
+    return table
+
+def warm_up():
+    """Load the catalog, similarity index and analysis table (once per process)"""
+    global data_loader, similarity_engine, analysis_table, ready, warm_up_seconds, warm_up_error
+    if ready:
+        return
+
+    with _warm_up_lock:
+        if ready:
+            return
+
+        start = time.perf_counter()
+        try:
+            loader = DataLoader(fuzzy_threshold=FUZZY_MATCH_THRESHOLD, use_snapshot=CATALOG_SNAPSHOT)
+
+            # With SHARED_INDEX_DIR set, the engine's catalog-sized arrays are built
+            # once and memory-mapped read-only by every worker (see gunicorn.conf.py)
+            engine = JobSimilarityEngine(
+                loader,
+                backend=os.getenv("NEIGHBOR_BACKEND", "exact"),
+                shared_dir=os.getenv("SHARED_INDEX_DIR") or None
+            )
+            table = load_analysis_table(loader, engine)
+        except Exception as error:
+            warm_up_error = f"{type(error).__name__}: {error}"
+            raise
+
+        data_loader, similarity_engine, analysis_table = loader, engine, table
+        warm_up_seconds = round(time.perf_counter() - start, 3)
+        warm_up_error = None
+        ready = True
+
+def ensure_warm():
+    """Block until the catalog is loaded; a no-op once warm"""
+    if not ready:
+        warm_up()
+
+async def wait_until_warm():
+    """ensure_warm() for async handlers, without blocking the event loop"""
+    if not ready:
+        await run_in_threadpool(warm_up)
+
+def get_compute_executor():
+    global compute_executor
+    if compute_executor is None and COMPUTE_EXECUTOR != "inline":
+        with _executor_lock:
+            if compute_executor is None:
+                compute_executor = create_executor(COMPUTE_EXECUTOR, COMPUTE_WORKERS, initializer=warm_up)
+    return compute_executor
+
+def compute_analyses(job_keys: List[str]) -> Dict[str, dict]:
+    """Static analyses for the given jobs, safer alternatives ranked in one pass.
+
+    Runs on the compute executor, possibly in another process.
+    """
+    ensure_warm()
+    jobs = [data_loader.get_job(job_key) for job_key in job_keys]
+    similar_jobs_batch = similarity_engine.find_similar_jobs_batch(jobs, top_k=SAFER_ROLES_COUNT)
+    return {
+        job_key: build_static_analysis(data_loader, similarity_engine, job_key, similar_jobs)
+        for job_key, similar_jobs in zip(job_keys, similar_jobs_batch)
+    }
+
+def fuzzy_job_keys(titles: List[str]) -> List[Optional[str]]:
+    """Typo-tolerant job keys for titles the index could not resolve; runs on the compute executor"""
+    ensure_warm()
+    return [data_loader.fuzzy_job_key(title) for title in titles]
+
+def suggest_job_titles(title: str) -> List[str]:
+    """Closest titles for the 404 hint on an unresolved query; runs on the compute executor"""
+    ensure_warm()
+    return data_loader.suggest_titles(title, limit=5, threshold=FUZZY_SUGGEST_THRESHOLD)
+
+async def compute_analyses_offloaded(job_keys: List[str]) -> Dict[str, dict]:
+    """compute_analyses() on the compute executor, or inline for small tasks"""
+    if len(job_keys) < COMPUTE_OFFLOAD_MIN_JOBS:
+        return compute_analyses(job_keys)
+    return await run_compute(get_compute_executor(), compute_analyses, job_keys)
 
 # Doom messages by risk tier
 DOOM_MESSAGES = {
@@ -43,78 +227,340 @@ DOOM_MESSAGES = {
 }
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to the Job Doom Calculator. Prepare for existential dread."}
 
 @app.post("/analyze", response_model=JobRiskResponse)
-def analyze_job(request: JobSearchRequest):
+async def analyze_job(request: JobSearchRequest, http_request: Request):
     """Main endpoint: analyze automation risk"""
+    await wait_until_warm()
+
+    job_key = (await resolve_job_or_404(request.job_title)).key
+
+    # Deterministic flavor makes whole responses revalidatable
+    headers = None
+    if FLAVOR_MODE != "random":
+        headers, not_modified = catalog_headers(http_request, tag=f"-{job_key}-{flavor_bucket()}")
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+
+    analysis = await get_static_analysis(job_key, request.experience_years, request.education_level)
+
+    # Pre-encoded bytes go out as-is, skipping response model re-validation
+    return RawJSONResponse(flavored_payload(job_key, analysis), headers=headers)
+
+@app.post("/analyze/batch", response_model=JobBatchResponse)
+async def analyze_jobs_batch(request: JobBatchRequest):
+    """Analyze many job titles in one round trip"""
+    await wait_until_warm()
+
+    # Direct and indexed lookups inline; every title left over is fuzzy-matched in one compute task
+    job_keys = {title: data_loader.find_job_key(title, fuzzy=False) for title in request.job_titles}
+    unresolved = [title for title, job_key in job_keys.items() if job_key is None]
+    if unresolved:
+        fuzzy_keys = await run_compute(get_compute_executor(), fuzzy_job_keys, unresolved)
+        job_keys.update(zip(unresolved, fuzzy_keys))
+
+    found_keys = []
+    not_found = []
+    for title in request.job_titles:
+        job_key = job_keys[title]
+        if job_key:
+            found_keys.append(job_key)
+        else:
+            not_found.append(title)
+
+    if request.slim:
+        results = []
+        for job_key in found_keys:
+            job_data = data_loader.get_job(job_key)
+            results.append(JobRiskSummary(
+                job_title=job_data.title,
+                risk_score=round(job_data.risk_score, 1),
+                tier=get_risk_tier(job_data.risk_score)
+            ))
+        return JobBatchResponse(results=results, not_found=not_found)
+
+    analyses = await get_default_analyses(found_keys)
+    results = b",".join(flavored_payload(job_key, analyses[job_key]) for job_key in found_keys)
+    return RawJSONResponse(b'{"results":[' + results + b'],"not_found":' + dumps(not_found) + b"}")
+
+@app.get("/analyze/stream")
+async def analyze_jobs_stream(
+    min_risk: float = Query(0, ge=0, le=100),
+    max_risk: float = Query(100, ge=0, le=100),
+    tier: Optional[str] = Query(None, pattern=TIER_PATTERN),
+    onet_prefix: str = "",
+    slim: bool = False
+):
+    """Analyses for every matching job in the catalog, one JSON object per line"""
+    await wait_until_warm()
 
-    job_data = data_loader.search_job(request.job_title)
-
-    if not job_data:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Job '{request.job_title}' not found. Try: Software Engineer, Truck Driver, Nurse, Data Analyst, Therapist"
-        )
-
-    # Calculate metrics
-    risk_score = job_data["risk_score"]
-    automation_progress = min(risk_score + random.uniform(-5, 10), 100)
-
-    # Determine confidence based on data quality (fake for now)
-    confidence = "High" if risk_score > 50 or risk_score < 30 else "Medium"
-
-    # Find safer alternatives
-    similar_jobs = similarity_engine.find_similar_jobs(job_data, top_k=3)
-
-    # Skills needed for top pivot
-    skills_to_learn = []
-    if similar_jobs:
-        top_pivot_key = similar_jobs[0]["title"].lower().replace(" ", "_")
-        top_pivot_data = data_loader.search_job(similar_jobs[0]["title"])
-        if top_pivot_data:
-            skills_to_learn = similarity_engine.calculate_skill_gap(job_data, top_pivot_data)
-
-    # Estimate retraining hours (10 hours per new skill)
-    retraining_hours = len(skills_to_learn) * 40 if skills_to_learn else None
-
-    # Generate doom message
-    if risk_score > 60:
-        tier = "high"
-    elif risk_score > 35:
-        tier = "medium"
-    else:
-        tier = "low"
-
-    doom_message = random.choice(DOOM_MESSAGES[tier]).format(int(risk_score))
-
-    # Task breakdown
-    total_tasks = len(job_data["tasks"]["automatable"]) + len(job_data["tasks"]["human_required"])
-    auto_pct = (len(job_data["tasks"]["automatable"]) / total_tasks) * 100
-
-    return JobRiskResponse(
-        job_title=job_data["title"],
-        risk_score=round(risk_score, 1),
-        automation_progress=round(automation_progress, 1),
-        confidence=confidence,
-        tech_drivers=job_data["tech_threats"],
-        task_breakdown={
-            "automatable": round(auto_pct, 0),
-            "human_required": round(100 - auto_pct, 0),
-            "automatable_tasks": job_data["tasks"]["automatable"],
-            "human_tasks": job_data["tasks"]["human_required"]
-        },
-        safer_roles=similar_jobs,
-        skills_to_learn=skills_to_learn,
-        doom_message=doom_message,
-        retraining_hours=retraining_hours
+    jobs, _ = data_loader.query_jobs(min_risk=min_risk, max_risk=max_risk, tier=tier)
+    job_keys = [job.key for job in jobs if job.onet_code.startswith(onet_prefix)]
+    return StreamingResponse(stream_analyses(job_keys, slim), media_type="application/x-ndjson")
+
+async def stream_analyses(job_keys: List[str], slim: bool):
+    """NDJSON lines for the given jobs, resolved one chunk at a time"""
+    for start in range(0, len(job_keys), STREAM_CHUNK_SIZE):
+        chunk = job_keys[start:start + STREAM_CHUNK_SIZE]
+        if slim:
+            for job_key in chunk:
+                job_data = data_loader.get_job(job_key)
+                yield dumps({
+                    "job_title": job_data.title,
+                    "risk_score": round(job_data.risk_score, 1),
+                    "tier": get_risk_tier(job_data.risk_score)
+                }) + b"\n"
+        else:
+            analyses = await get_default_analyses(chunk)
+            for job_key in chunk:
+                yield flavored_payload(job_key, analyses[job_key]) + b"\n"
+        # Let other requests in between chunks of a long export
+        await asyncio.sleep(0)
+
+@app.get("/skill-gap", response_model=SkillGapResponse)
+async def skill_gap(from_title: str = Query(..., alias="from"), to_title: str = Query(..., alias="to")):
+    """Skills and retraining hours needed to move between two jobs"""
+    await wait_until_warm()
+
+    current_job = await resolve_job_or_404(from_title)
+    target_job = await resolve_job_or_404(to_title)
+
+    gap_skills = similarity_engine.calculate_skill_gap(current_job, target_job)
+    gap_size = similarity_engine.skill_gap_size(current_job, target_job)
+    gap_percentage = gap_size / len(target_job.skills) * 100 if target_job.skills else 0.0
+
+    return SkillGapResponse(
+        from_job=current_job.title,
+        to_job=target_job.title,
+        current_skills=list(current_job.skills),
+        target_skills=list(target_job.skills),
+        shared_skills=[skill for skill in target_job.skills if skill in current_job.skill_set],
+        gap_skills=gap_skills,
+        gap_percentage=round(gap_percentage, 0),
+        overlap_percentage=round(100 - gap_percentage, 0),
+        retraining_hours=similarity_engine.retraining_hours(current_job, target_job)
     )
 
+async def resolve_job_or_404(title: str):
+    """Resolve a title to its job record, or raise a 404 with suggestions.
+
+    Only direct and indexed lookups run on the event loop; the edit-distance
+    fallbacks go to the compute executor.
+    """
+    job_key = data_loader.find_job_key(title, fuzzy=False)
+    if job_key is None:
+        job_key = (await run_compute(get_compute_executor(), fuzzy_job_keys, [title]))[0]
+    if job_key:
+        return data_loader.get_job(job_key)
+
+    suggestions = await run_compute(get_compute_executor(), suggest_job_titles, title)
+    hint = "Did you mean" if suggestions else "Try"
+    suggestions = suggestions or ["Software Engineer", "Truck Driver", "Nurse", "Data Analyst", "Therapist"]
+    raise HTTPException(
+        status_code=404,
+        detail=f"Job '{title}' not found. {hint}: {', '.join(suggestions)}"
+    )
+
+@app.get("/health")
+async def health():
+    """Readiness probe: 503 until the catalog and indexes are loaded"""
+    if not ready:
+        status = "error" if warm_up_error else "warming"
+        return FastJSONResponse({"status": status, "error": warm_up_error}, status_code=503)
+
+    return {
+        "status": "ok",
+        "job_count": len(data_loader.records),
+        "catalog": data_loader.content_hash,
+        "catalog_source": data_loader.source,
+        "similarity_index": similarity_engine.source,
+        "warm_up_seconds": warm_up_seconds
+    }
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the /analyze cache"""
+    return analysis_cache.stats()
+
+async def get_default_analyses(job_keys: List[str]) -> Dict[str, dict]:
+    """Static analyses for default request options; shares cache entries with /analyze"""
+    defaults = JobSearchRequest(job_title="")
+    analyses = {}
+    missing_keys = []
+    for job_key in dict.fromkeys(job_keys):
+        if analysis_table is not None:
+            analysis = analysis_table.get(job_key)
+        else:
+            analysis = analysis_cache.get((job_key, defaults.experience_years, defaults.education_level))
+        if analysis is None:
+            missing_keys.append(job_key)
+        else:
+            analyses[job_key] = analysis
+
+    # Every cache miss in one compute task
+    if missing_keys:
+        computed = await compute_analyses_offloaded(missing_keys)
+        for job_key, analysis in computed.items():
+            analyses[job_key] = analysis
+            analysis_cache.set((job_key, defaults.experience_years, defaults.education_level), analysis)
+    return analyses
+
+async def get_static_analysis(job_key: str, experience_years: int, education_level: str) -> dict:
+    """Static analysis from the precomputed table, or the LRU cache when precompute is off"""
+    if analysis_table is not None:
+        analysis = analysis_table.get(job_key)
+        if analysis is not None:
+            return analysis
+
+    cache_key = (job_key, experience_years, education_level)
+    analysis = analysis_cache.get(cache_key)
+    if analysis is None:
+        computed = await compute_analyses_offloaded([job_key])
+        analysis = computed[job_key]
+        analysis_cache.set(cache_key, analysis)
+    return analysis
+
+def flavor_bucket() -> str:
+    """Seed component that changes when deterministic flavor should re-roll"""
+    if FLAVOR_MODE == "daily":
+        return datetime.now(timezone.utc).date().isoformat()
+    return FLAVOR_MODE
+
+def flavor_rng(job_title: str):
+    """Random source for flavor: global in random mode, else seeded from the title"""
+    if FLAVOR_MODE == "random":
+        return random
+    seed_text = f"{job_title}|{flavor_bucket()}"
+    return random.Random(int.from_bytes(hashlib.sha256(seed_text.encode("utf-8")).digest()[:8], "big"))
+
+def flavored_payload(job_key: str, analysis: dict) -> bytes:
+    """JSON bytes of a full risk response: the static payload plus fresh flavor fields"""
+
+    rng = flavor_rng(analysis["job_title"])
+    risk_score = analysis["raw_risk_score"]
+    automation_progress = min(risk_score + rng.uniform(-5, 10), 100)
+    doom_message = rng.choice(DOOM_MESSAGES[analysis["tier"]]).format(int(risk_score))
+
+    encoded = analysis_table.get_encoded(job_key) if analysis_table is not None else None
+    if encoded is None:
+        encoded = encode_payload(analysis)
+
+    # Splice the flavor fields into the closing brace of the static object
+    return (
+        encoded[:-1]
+        + b',"automation_progress":' + dumps(round(automation_progress, 1))
+        + b',"doom_message":' + dumps(doom_message)
+        + b"}"
+    )
+
+def catalog_headers(request: Request, tag: str = ""):
+    """ETag/Cache-Control headers for catalog-derived responses, plus whether the client copy is fresh"""
+    etag = f'"{data_loader.content_hash}{tag}"'
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    not_modified = etag in if_none_match or if_none_match.strip() == "*"
+    return headers, not_modified
+
 @app.get("/jobs")
-def list_jobs():
-    """List all available jobs"""
-    return {"jobs": [job["title"] for job in data_loader.get_all_jobs()]}
+async def list_jobs(
+    request: Request,
+    min_risk: Optional[float] = Query(None, ge=0, le=100),
+    max_risk: Optional[float] = Query(None, ge=0, le=100),
+    tier: Optional[str] = Query(None, pattern=TIER_PATTERN),
+    sort: str = Query("catalog", pattern=JOB_SORT_PATTERN),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000)
+):
+    """List available jobs, optionally filtered by risk range or tier, sorted and paginated"""
+    await wait_until_warm()
+
+    # Unfiltered listing: one pre-encoded body for the whole catalog
+    if not request.query_params:
+        headers, not_modified = catalog_headers(request)
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return RawJSONResponse(jobs_payload(), headers=headers)
+
+    query_tag = hashlib.sha1(str(sorted(request.query_params.multi_items())).encode("utf-8")).hexdigest()[:12]
+    headers, not_modified = catalog_headers(request, tag=f"-{query_tag}")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    jobs, total = data_loader.query_jobs(
+        min_risk=min_risk, max_risk=max_risk, tier=tier, sort=sort, offset=offset, limit=limit
+    )
+    return FastJSONResponse({
+        "jobs": [job.title for job in jobs],
+        "risk_scores": [round(job.risk_score, 1) for job in jobs],
+        "total": total,
+        "offset": offset,
+        "limit": limit
+    }, headers=headers)
+
+def jobs_payload() -> bytes:
+    """Encoded /jobs body, built once per catalog"""
+    global _jobs_payload
+    if _jobs_payload is None or _jobs_payload[0] != data_loader.content_hash:
+        body = dumps({"jobs": [job.title for job in data_loader.get_all_jobs()]})
+        _jobs_payload = (data_loader.content_hash, body)
+    return _jobs_payload[1]
+
+_jobs_payload = None
+
+@app.get("/suggest")
+async def suggest_jobs(request: Request, response: Response, q: str = "", limit: int = Query(10, ge=1, le=50)):
+    """Autocomplete job titles from the prefix index"""
+    await wait_until_warm()
+    query_tag = hashlib.sha1(f"{q.lower()}|{limit}".encode("utf-8")).hexdigest()[:12]
+    headers, not_modified = catalog_headers(request, tag=f"-{query_tag}")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    job_keys = data_loader.title_index.search(q, limit=limit)
+    return {"query": q, "suggestions": [data_loader.jobs_data[key].title for key in job_keys]}
+
+@app.get("/stats", response_model=StatsResponse)
+async def get_stats():
+    """Aggregate risk statistics, precomputed when the catalog loads"""
+    await wait_until_warm()
+    return data_loader.stats
+
+@app.get("/groups", response_model=OccupationGroupsResponse)
+async def list_occupation_groups(request: Request, level: str = Query("major", pattern=SOC_LEVEL_PATTERN)):
+    """Precomputed risk aggregates for every SOC group at one level"""
+    await wait_until_warm()
+    headers, not_modified = catalog_headers(request, tag=f"-groups-{level}")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    return FastJSONResponse(
+        {"level": level, "groups": data_loader.occupation_index.rollup(level)}, headers=headers
+    )
+
+@app.get("/groups/{code}", response_model=OccupationGroupDetail)
+async def get_occupation_group(code: str, request: Request):
+    """One SOC group's aggregates, its subgroups and its jobs"""
+    await wait_until_warm()
+    occupation_index = data_loader.occupation_index
+    group = occupation_index.get_group(code)
+    if group is None:
+        raise HTTPException(status_code=404, detail=f"No occupation group '{code}' in the catalog")
+
+    headers, not_modified = catalog_headers(request, tag=f"-group-{code}")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    return FastJSONResponse({
+        **group.summary,
+        "children": [occupation_index.groups[child].summary for child in group.children],
+        "jobs": [
+            {"job_title": job.title, "risk_score": round(job.risk_score, 1), "tier": get_risk_tier(job.risk_score)}
+            for job in occupation_index.group_jobs(code)
+        ]
+    }, headers=headers)
 
 if __name__ == "__main__":
     import uvicorn
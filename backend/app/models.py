@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
+
+MAX_BATCH_SIZE = 500
 
 class JobRiskResponse(BaseModel):
     job_title: str
@@ -22,3 +24,53 @@ class JobSearchRequest(BaseModel):
     job_title: str
     experience_years: Optional[int] = 5
     education_level: Optional[str] = "bachelor"
+
+class JobRiskSummary(BaseModel):
+    job_title: str
+    risk_score: float  # 0-100
+    tier: str  # "high", "medium", "low"
+
+class JobBatchRequest(BaseModel):
+    job_titles: List[str] = Field(..., max_length=MAX_BATCH_SIZE)
+    slim: bool = False  # risk-only projection, skips pivots and skill gaps
+
+class JobBatchResponse(BaseModel):
+    results: List[Union[JobRiskResponse, JobRiskSummary]]
+    not_found: List[str]
+
+class StatsResponse(BaseModel):
+    job_count: int
+    average_risk: float  # 0-100
+    tier_counts: dict  # {"high": 12, "medium": 20, "low": 17}
+    ranked_jobs: List[JobRiskSummary]  # highest risk first
+
+class SkillGapResponse(BaseModel):
+    from_job: str
+    to_job: str
+    current_skills: List[str]
+    target_skills: List[str]
+    shared_skills: List[str]
+    gap_skills: List[str]  # in the target job's skill order
+    gap_percentage: float  # share of target skills still to learn, 0-100
+    overlap_percentage: float  # 100 - gap_percentage
+    retraining_hours: int
+
+class OccupationGroupSummary(BaseModel):
+    code: str  # SOC group code, e.g. "15-0000"
+    level: str  # "major", "minor", "broad"
+    name: Optional[str]  # SOC title; major groups only
+    parent: Optional[str]
+    job_count: int
+    mean_risk: float  # 0-100
+    weighted_risk: float  # employment-weighted where jobs report it, else mean_risk
+    employment: Optional[int]
+    tier_counts: dict  # {"high": 1, "medium": 3, "low": 0}
+    top_threats: List[str]  # most common across the group's jobs
+
+class OccupationGroupsResponse(BaseModel):
+    level: str
+    groups: List[OccupationGroupSummary]
+
+class OccupationGroupDetail(OccupationGroupSummary):
+    children: List[OccupationGroupSummary]  # next level down
+    jobs: List[JobRiskSummary]  # highest risk first
@@ -0,0 +1,113 @@
+"""
+Pluggable nearest-neighbour backends for JobSimilarityEngine.
+
+A backend only proposes candidate rows for a unit-length query vector. The
+engine then scores the candidates exactly and applies the "only safer jobs"
+risk filter, so every backend returns the same kind of result and an
+approximate backend can only miss neighbours, never invent them.
+"""
+from typing import Dict, Type
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:  # Optional: only needed for the "hnsw" backend
+    hnswlib = None
+
+class ExactBackend:
+    """Brute force: every catalog job is a candidate"""
+
+    approximate = False
+
+    def __init__(self, unit_vectors: np.ndarray):
+        self.all_rows = np.arange(len(unit_vectors))
+
+    def candidates(self, query: np.ndarray, pool_size: int) -> np.ndarray:
+        return self.all_rows
+
+class LSHBackend:
+    """Random-hyperplane LSH (SimHash) in pure NumPy.
+
+    Each of ``n_tables`` tables hashes a vector to the sign pattern of
+    ``n_bits`` random projections. A query collects the rows sharing its
+    bucket in any table, plus buckets one bit away (multi-probe) for recall.
+    """
+
+    approximate = True
+
+    def __init__(self, unit_vectors: np.ndarray, n_tables: int = 8, n_bits: int = None,
+                 multi_probe: bool = True, seed: int = 0):
+        row_count, dims = unit_vectors.shape
+        if n_bits is None:
+            # Aim for a few rows per bucket
+            n_bits = int(np.clip(np.log2(max(row_count, 2)) - 2, 2, 20))
+
+        # Hash offsets from the catalog mean: skill vectors are non-negative, so
+        # hyperplanes through the origin would barely split them
+        self.center = unit_vectors.mean(axis=0)
+        rng = np.random.default_rng(seed)
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.planes = rng.standard_normal((dims, n_tables * n_bits))
+        self.bit_values = 1 << np.arange(n_bits)
+        self.probe_masks = np.concatenate(([0], self.bit_values)) if multi_probe else np.array([0])
+
+        # Per table: bucket code -> rows in that bucket
+        codes = self._codes(unit_vectors)
+        self.buckets = []
+        for table_codes in codes.T:
+            order = np.argsort(table_codes, kind="stable")
+            unique_codes, starts = np.unique(table_codes[order], return_index=True)
+            self.buckets.append(dict(zip(unique_codes.tolist(), np.split(order, starts[1:]))))
+
+    def _codes(self, vectors: np.ndarray) -> np.ndarray:
+        """Bucket code per table, shape (rows, n_tables), all tables in one product"""
+        signs = ((vectors - self.center) @ self.planes) > 0
+        return signs.reshape(-1, self.n_tables, self.n_bits) @ self.bit_values
+
+    def candidates(self, query: np.ndarray, pool_size: int) -> np.ndarray:
+        found = []
+        probes = self._codes(query)[0][:, None] ^ self.probe_masks
+        for buckets, table_probes in zip(self.buckets, probes.tolist()):
+            for probe in table_probes:
+                rows = buckets.get(probe)
+                if rows is not None:
+                    found.append(rows)
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+class HNSWBackend:
+    """HNSW graph index via the optional hnswlib package"""
+
+    approximate = True
+
+    def __init__(self, unit_vectors: np.ndarray, M: int = 16, ef_construction: int = 200, ef: int = 200):
+        if hnswlib is None:
+            raise ImportError("The 'hnsw' neighbour backend needs hnswlib (pip install hnswlib)")
+
+        row_count, dims = unit_vectors.shape
+        self.index = hnswlib.Index(space="ip", dim=dims)
+        self.index.init_index(max_elements=max(row_count, 1), ef_construction=ef_construction, M=M)
+        self.index.add_items(unit_vectors.astype(np.float32), np.arange(row_count))
+        self.ef = ef
+        self.row_count = row_count
+
+    def candidates(self, query: np.ndarray, pool_size: int) -> np.ndarray:
+        k = min(pool_size, self.row_count)
+        self.index.set_ef(max(self.ef, k))
+        labels, _ = self.index.knn_query(query.astype(np.float32), k=k)
+        return labels[0].astype(np.int64)
+
+BACKENDS: Dict[str, Type] = {
+    "exact": ExactBackend,
+    "lsh": LSHBackend,
+    "hnsw": HNSWBackend,
+}
+
+def create_backend(name: str, unit_vectors: np.ndarray, **options):
+    """Instantiate a neighbour backend by name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown neighbour backend '{name}'; choose from {', '.join(BACKENDS)}")
+    return BACKENDS[name](unit_vectors, **options)
@@ -0,0 +1,136 @@
+"""
+SOC occupation-group hierarchy over the job catalog.
+
+O*NET-SOC codes nest four levels deep: 15-1252.00 is detailed occupation
+15-1252 in broad group 15-1250, minor group 15-1200 and major group 15-0000.
+OccupationIndex groups catalog rows at each level once, when the catalog
+loads, and precomputes every group's aggregates. A rollup is then a lookup,
+and drilling into a group touches only that group's rows.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.records import JobRecord
+
+SOC_LEVELS = ("major", "minor", "broad")
+
+# SOC 2018 major groups
+SOC_MAJOR_GROUPS = {
+    "11-0000": "Management Occupations",
+    "13-0000": "Business and Financial Operations Occupations",
+    "15-0000": "Computer and Mathematical Occupations",
+    "17-0000": "Architecture and Engineering Occupations",
+    "19-0000": "Life, Physical, and Social Science Occupations",
+    "21-0000": "Community and Social Service Occupations",
+    "23-0000": "Legal Occupations",
+    "25-0000": "Educational Instruction and Library Occupations",
+    "27-0000": "Arts, Design, Entertainment, Sports, and Media Occupations",
+    "29-0000": "Healthcare Practitioners and Technical Occupations",
+    "31-0000": "Healthcare Support Occupations",
+    "33-0000": "Protective Service Occupations",
+    "35-0000": "Food Preparation and Serving Related Occupations",
+    "37-0000": "Building and Grounds Cleaning and Maintenance Occupations",
+    "39-0000": "Personal Care and Service Occupations",
+    "41-0000": "Sales and Related Occupations",
+    "43-0000": "Office and Administrative Support Occupations",
+    "45-0000": "Farming, Fishing, and Forestry Occupations",
+    "47-0000": "Construction and Extraction Occupations",
+    "49-0000": "Installation, Maintenance, and Repair Occupations",
+    "51-0000": "Production Occupations",
+    "53-0000": "Transportation and Material Moving Occupations",
+    "55-0000": "Military Specific Occupations",
+}
+
+# Minor groups are XX-Y000, except these SOC 2018 groups coded XX-YY00
+_HUNDRED_MINOR_GROUPS = {"15-12", "31-11", "51-51"}
+
+# Most frequent tech threats reported per group
+TOP_THREATS = 3
+
+def soc_group_codes(onet_code: str) -> Tuple[str, str, str]:
+    """(major, minor, broad) group codes for an O*NET-SOC code like 15-1252.00"""
+    soc = onet_code.split(".")[0]
+    minor = soc[:5] + "00" if soc[:5] in _HUNDRED_MINOR_GROUPS else soc[:4] + "000"
+    return soc[:2] + "-0000", minor, soc[:6] + "0"
+
+@dataclass(slots=True)
+class OccupationGroup:
+    """One SOC group: its catalog rows (ascending) and precomputed aggregates"""
+    code: str
+    level: str
+    parent: Optional[str]
+    rows: np.ndarray
+    summary: Dict = field(default_factory=dict)
+    children: List[str] = field(default_factory=list)
+
+class OccupationIndex:
+    """SOC major/minor/broad groups of the catalog, keyed by group code"""
+
+    def __init__(self, records: List[JobRecord], risk_scores: np.ndarray, risk_tiers: List[str]):
+        self.records = records
+        self.risk_tiers = risk_tiers
+        self.groups: Dict[str, OccupationGroup] = {}
+
+        # Code -> (level, parent code, member rows), rows in catalog order
+        members = {}
+        for record in records:
+            parent = None
+            for level, code in zip(SOC_LEVELS, soc_group_codes(record.onet_code)):
+                members.setdefault(code, (level, parent, []))[2].append(record.index)
+                parent = code
+
+        for code, (level, parent, rows) in sorted(members.items()):
+            self.groups[code] = OccupationGroup(code, level, parent, np.array(rows, dtype=np.int32))
+        for group in self.groups.values():
+            if group.parent is not None:
+                self.groups[group.parent].children.append(group.code)
+            group.summary = self._summarize(group, risk_scores)
+
+    def _summarize(self, group: OccupationGroup, risk_scores: np.ndarray) -> Dict:
+        """Aggregates for one group, computed from its own rows"""
+        risks = risk_scores[group.rows]
+        jobs = [self.records[row] for row in group.rows]
+
+        # Weighted by employment over the jobs that report it; the plain mean otherwise
+        employment = np.array([job.employment or 0 for job in jobs], dtype=np.float64)
+        total_employment = int(employment.sum())
+        if total_employment:
+            weighted_risk = float(np.dot(risks, employment) / total_employment)
+        else:
+            weighted_risk = float(risks.mean())
+
+        tier_counts = {"high": 0, "medium": 0, "low": 0}
+        threats = Counter()
+        for job in jobs:
+            tier_counts[self.risk_tiers[job.index]] += 1
+            threats.update(job.tech_threats)
+
+        return {
+            "code": group.code,
+            "level": group.level,
+            "name": SOC_MAJOR_GROUPS.get(group.code),
+            "parent": group.parent,
+            "job_count": len(jobs),
+            "mean_risk": round(float(risks.mean()), 1),
+            "weighted_risk": round(weighted_risk, 1),
+            "employment": total_employment or None,
+            "tier_counts": tier_counts,
+            "top_threats": [threat for threat, _ in threats.most_common(TOP_THREATS)],
+        }
+
+    def rollup(self, level: str) -> List[Dict]:
+        """Aggregates of every group at one level, by code"""
+        return [group.summary for group in self.groups.values() if group.level == level]
+
+    def get_group(self, code: str) -> Optional[OccupationGroup]:
+        return self.groups.get(code)
+
+    def group_jobs(self, code: str) -> List[JobRecord]:
+        """Jobs in a group, highest risk first; reads only the group's own rows"""
+        group = self.groups.get(code)
+        if group is None:
+            return []
+        return sorted((self.records[row] for row in group.rows), key=lambda job: job.risk_score, reverse=True)
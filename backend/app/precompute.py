@@ -0,0 +1,161 @@
+"""
+Precomputed per-job analysis payloads.
+
+Everything /analyze returns except the flavor fields (automation_progress and
+doom_message) depends only on the static catalog, so it is materialized once
+per catalog load. The table can also be written to disk and loaded by other
+worker processes:
+
+    python -m app.precompute --out data/cache/analyses.json
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.data_loader import get_risk_tier
+from app.responses import dumps
+from app.similarity import RETRAINING_HOURS_PER_SKILL
+
+# Internal fields kept alongside the public payload for flavor generation
+INTERNAL_FIELDS = ("tier", "raw_risk_score")
+
+# Safer alternatives listed per analysis
+SAFER_ROLES_COUNT = 3
+
+# Bump whenever the payload layout or how analyses are built changes; stored
+# tables from older code are then rebuilt instead of served
+TABLE_VERSION = 1
+
+def build_static_analysis(data_loader, similarity_engine, job_key: str, similar_jobs: list = None) -> dict:
+    """Everything in a risk response that depends only on the catalog"""
+
+    job_data = data_loader.get_job(job_key)
+    risk_score = job_data.risk_score
+
+    # Find safer alternatives
+    if similar_jobs is None:
+        similar_jobs = similarity_engine.find_similar_jobs(job_data, top_k=SAFER_ROLES_COUNT)
+
+    # Determine confidence based on data quality (fake for now)
+    confidence = "High" if risk_score > 50 or risk_score < 30 else "Medium"
+
+    # Skills needed for top pivot
+    skills_to_learn = []
+    if similar_jobs:
+        top_pivot_data = data_loader.search_job(similar_jobs[0]["title"])
+        if top_pivot_data:
+            skills_to_learn = similarity_engine.calculate_skill_gap(job_data, top_pivot_data)
+
+    # Estimate retraining hours (40 hours per new skill)
+    retraining_hours = len(skills_to_learn) * RETRAINING_HOURS_PER_SKILL if skills_to_learn else None
+
+    # Task breakdown
+    total_tasks = len(job_data.automatable_tasks) + len(job_data.human_tasks)
+    auto_pct = (len(job_data.automatable_tasks) / total_tasks) * 100
+
+    return {
+        "job_title": job_data.title,
+        "risk_score": round(risk_score, 1),
+        "confidence": confidence,
+        "tech_drivers": list(job_data.tech_threats),
+        "task_breakdown": {
+            "automatable": round(auto_pct, 0),
+            "human_required": round(100 - auto_pct, 0),
+            "automatable_tasks": list(job_data.automatable_tasks),
+            "human_tasks": list(job_data.human_tasks)
+        },
+        "safer_roles": similar_jobs,
+        "skills_to_learn": skills_to_learn,
+        "retraining_hours": retraining_hours,
+        "tier": get_risk_tier(risk_score),
+        "raw_risk_score": risk_score
+    }
+
+def encode_payload(analysis: dict) -> bytes:
+    """Compact JSON bytes of the public part of an analysis"""
+    public = {field: value for field, value in analysis.items() if field not in INTERNAL_FIELDS}
+    return dumps(public)
+
+def table_key(data_loader, similarity_engine) -> Dict:
+    """Everything a stored table was built from; a table is reused only when all of it matches"""
+    return {
+        "version": TABLE_VERSION,
+        "content_hash": data_loader.content_hash,
+        "backend": similarity_engine.backend_name,
+        "neighbors_k": similarity_engine.neighbors_k,
+        "safer_roles": SAFER_ROLES_COUNT,
+        "retraining_hours_per_skill": RETRAINING_HOURS_PER_SKILL,
+    }
+
+class AnalysisTable:
+    """Static analyses for every job, keyed by job key"""
+
+    def __init__(self, analyses: Dict[str, dict], key: Dict, serialize: bool = False):
+        self.analyses = analyses
+        self.key = key
+        self.content_hash = key["content_hash"]
+        self.encoded = None
+        if serialize:
+            self.encoded = {job_key: encode_payload(analysis) for job_key, analysis in analyses.items()}
+
+    @classmethod
+    def build(cls, data_loader, similarity_engine, serialize: bool = False) -> "AnalysisTable":
+        """Materialize the table from a loaded catalog"""
+        job_keys = list(data_loader.jobs_data)
+        jobs = [data_loader.get_job(job_key) for job_key in job_keys]
+
+        # Safer alternatives for the whole catalog in one pass
+        similar_jobs_batch = similarity_engine.find_similar_jobs_batch(jobs, top_k=SAFER_ROLES_COUNT)
+        analyses = {
+            job_key: build_static_analysis(data_loader, similarity_engine, job_key, similar_jobs)
+            for job_key, similar_jobs in zip(job_keys, similar_jobs_batch)
+        }
+        return cls(analyses, table_key(data_loader, similarity_engine), serialize=serialize)
+
+    @classmethod
+    def load(cls, path: Path, key: Dict, serialize: bool = False) -> Optional["AnalysisTable"]:
+        """Load a table written by save(), or None if missing or built from other data or code"""
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if stored.get("key") != key:
+            return None
+        return cls(stored["analyses"], key, serialize=serialize)
+
+    def save(self, path: Path) -> None:
+        """Write the table for other processes to load"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"key": self.key, "analyses": self.analyses}, f, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    def get(self, job_key: str) -> Optional[dict]:
+        return self.analyses.get(job_key)
+
+    def get_encoded(self, job_key: str) -> Optional[bytes]:
+        return self.encoded.get(job_key) if self.encoded is not None else None
+
+    def __len__(self) -> int:
+        return len(self.analyses)
+
+def main():
+    from app.data_loader import DataLoader
+    from app.similarity import JobSimilarityEngine
+
+    parser = argparse.ArgumentParser(description="Write the precomputed analysis table to disk")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--out", default="data/cache/analyses.json")
+    args = parser.parse_args()
+
+    data_loader = DataLoader(args.data_dir)
+    table = AnalysisTable.build(data_loader, JobSimilarityEngine(data_loader))
+    table.save(Path(args.out))
+    print(f"Wrote {len(table)} analyses for catalog {table.content_hash} to {args.out}")
+
+if __name__ == "__main__":
+    main()
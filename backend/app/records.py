@@ -0,0 +1,74 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
+
+def _intern_all(values) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+@dataclass(slots=True)
+class JobRecord:
+    """One occupation in the loaded catalog.
+
+    Strings are interned so skills, threats and tasks shared between jobs are
+    stored once, and list fields are tuples. ``index`` is the job's row in the
+    catalog-wide arrays kept by DataLoader (risk scores, skill vectors).
+    ``skill_mask`` has bit ``i`` set when the job needs vocabulary skill ``i``.
+    """
+    key: str
+    index: int
+    title: str
+    risk_score: float
+    onet_code: str
+    automatable_tasks: Tuple[str, ...]
+    human_tasks: Tuple[str, ...]
+    skills: Tuple[str, ...]
+    skill_set: FrozenSet[str]
+    tech_threats: Tuple[str, ...]
+    skill_vector: Tuple[float, ...]
+    skill_mask: int = 0
+    alternate_titles: Tuple[str, ...] = ()
+    employment: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, key: str, index: int, job: Dict, skill_ids: Dict[str, int]) -> "JobRecord":
+        """Build a record from a validated catalog entry and the skill vocabulary"""
+        skills = _intern_all(job["skills"])
+        skill_mask = 0
+        for skill in skills:
+            skill_mask |= 1 << skill_ids[skill]
+        return cls(
+            key=sys.intern(key),
+            index=index,
+            title=sys.intern(job["title"]),
+            risk_score=float(job["risk_score"]),
+            onet_code=sys.intern(job["onet_code"]),
+            automatable_tasks=_intern_all(job["tasks"]["automatable"]),
+            human_tasks=_intern_all(job["tasks"]["human_required"]),
+            skills=skills,
+            skill_set=frozenset(skills),
+            tech_threats=_intern_all(job["tech_threats"]),
+            skill_vector=tuple(float(value) for value in job["skill_vector"]),
+            skill_mask=skill_mask,
+            alternate_titles=_intern_all(job.get("alternate_titles", ())),
+            employment=job.get("employment"),
+        )
+
+    def to_dict(self) -> Dict:
+        """Catalog entry in the jobs_normalized.json layout"""
+        job = {
+            "title": self.title,
+            "risk_score": self.risk_score,
+            "onet_code": self.onet_code,
+            "tasks": {
+                "automatable": list(self.automatable_tasks),
+                "human_required": list(self.human_tasks)
+            },
+            "skills": list(self.skills),
+            "tech_threats": list(self.tech_threats),
+            "skill_vector": list(self.skill_vector)
+        }
+        if self.alternate_titles:
+            job["alternate_titles"] = list(self.alternate_titles)
+        if self.employment is not None:
+            job["employment"] = self.employment
+        return job
@@ -0,0 +1,202 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from app.records import JobRecord
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Partial words shorter than this never resolve a title on their own
+# ("c++" tokenizes to "c", which is not a reason to answer with Chef)
+MIN_PARTIAL_TOKEN = 3
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase a title and split it into alphanumeric tokens"""
+    return [token for token in _NON_ALNUM.split(text.lower()) if token]
+
+def trigrams(text: str) -> Set[str]:
+    """Padded character trigrams of a normalized title"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Levenshtein distance, or None as soon as it must exceed max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        # Every later row is at least this row's minimum
+        if min(current) > max_distance:
+            return None
+        previous = current
+
+    return previous[-1] if previous[-1] <= max_distance else None
+
+class TitleIndex:
+    """Title lookup structures built once per catalog load.
+
+    Every job title (plus any ``alternate_titles``) becomes an entry. Entries
+    are reachable through a normalized-title hash map, a token inverted
+    index and a prefix trie over tokens, so a query only touches the
+    entries that share its tokens. A character trigram index backs the
+    typo-tolerant ``fuzzy_search``.
+    """
+
+    # Fuzzy candidates kept (by shared trigrams) before edit distances run
+    FUZZY_CANDIDATES = 50
+
+    def __init__(self, jobs: List[JobRecord]):
+        self.entry_keys: List[str] = []
+        self.entry_tokens: List[List[str]] = []
+        self.entry_texts: List[str] = []
+        self.exact: Dict[str, str] = {}
+        self.inverted: Dict[str, Set[int]] = {}
+        self.trie: Dict = {}
+        self.trigrams: Dict[str, Set[int]] = {}
+
+        for job in jobs:
+            for title in (job.title,) + job.alternate_titles:
+                self._add_entry(job.key, title)
+
+    def _add_entry(self, key: str, title: str):
+        tokens = tokenize(title)
+        if not tokens:
+            return
+
+        entry_id = len(self.entry_keys)
+        text = " ".join(tokens)
+        self.entry_keys.append(key)
+        self.entry_tokens.append(tokens)
+        self.entry_texts.append(text)
+        self.exact.setdefault(text, key)
+
+        for gram in trigrams(text):
+            self.trigrams.setdefault(gram, set()).add(entry_id)
+
+        for token in set(tokens):
+            self.inverted.setdefault(token, set()).add(entry_id)
+
+            # Each trie node holds the entries with a token under that prefix
+            node = self.trie
+            for char in token:
+                node = node.setdefault(char, {"entries": set()})
+                node["entries"].add(entry_id)
+
+    def _prefix_entries(self, prefix: str) -> Set[int]:
+        node = self.trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return node["entries"]
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Ranked job keys whose titles match every query token by prefix"""
+        ranks = self._ranked(tokenize(query))
+        return sorted(ranks, key=ranks.get)[:limit]
+
+    def _ranked(self, query_tokens: List[str]) -> Dict[str, tuple]:
+        """Best rank per matching job key (see _rank)"""
+        if not query_tokens:
+            return {}
+
+        query_text = " ".join(query_tokens)
+
+        # Intersect the smallest candidate sets first
+        candidate_sets = sorted((self._prefix_entries(token) for token in query_tokens), key=len)
+        candidates = set(candidate_sets[0])
+        for entries in candidate_sets[1:]:
+            candidates &= entries
+            if not candidates:
+                return {}
+
+        best = {}
+        for entry_id in candidates:
+            rank = self._rank(entry_id, query_text, query_tokens)
+            key = self.entry_keys[entry_id]
+            if key not in best or rank < best[key]:
+                best[key] = rank
+        return best
+
+    def _rank(self, entry_id: int, query_text: str, query_tokens: List[str]) -> tuple:
+        """Sort key for a candidate entry: lower is a better match"""
+        text = self.entry_texts[entry_id]
+        tokens = self.entry_tokens[entry_id]
+
+        if text == query_text:
+            match = 0
+        elif text.startswith(query_text):
+            match = 1
+        elif query_text in text:
+            match = 2
+        elif all(token in self.inverted and entry_id in self.inverted[token] for token in query_tokens):
+            match = 3  # Whole-word matches, out of order
+        else:
+            match = 4  # Prefix-only matches
+
+        # Prefer titles with fewer extra words, then catalog order
+        return (match, len(tokens) - len(query_tokens), entry_id)
+
+    def best_match(self, query: str) -> Optional[str]:
+        """Key of the highest-ranked match, if any"""
+        exact_key = self.exact.get(" ".join(tokenize(query)))
+        if exact_key:
+            return exact_key
+
+        query_tokens = tokenize(query)
+        ranks = self._ranked(query_tokens)
+        if not ranks:
+            return None
+
+        # Only confident matches resolve on their own; the rest are left to
+        # the fuzzy fallback and the 404 suggestions
+        key = min(ranks, key=ranks.get)
+        match, _, entry_id = ranks[key]
+        if match > 3:
+            return None
+        # A short partial word is fine after a whole one ("data an"), not alone ("c")
+        title_tokens = set(self.entry_tokens[entry_id])
+        partial = [token for token in query_tokens if token not in title_tokens]
+        if len(partial) == len(query_tokens) and any(len(token) < MIN_PARTIAL_TOKEN for token in partial):
+            return None
+        return key
+
+    def fuzzy_search(self, query: str, limit: int = 5, threshold: float = 0.8) -> List[Tuple[str, float]]:
+        """Typo-tolerant matches as (job key, score) pairs, best first.
+
+        Score is ``1 - edit_distance / longer_length``; matches below
+        ``threshold`` are dropped, which also bounds the edit distance search.
+        """
+        query_text = " ".join(tokenize(query))
+        if not query_text:
+            return []
+
+        # Shortlist entries by shared trigrams before paying for edit distance
+        shared = Counter()
+        for gram in trigrams(query_text):
+            for entry_id in self.trigrams.get(gram, ()):
+                shared[entry_id] += 1
+
+        best = {}
+        for entry_id, _ in shared.most_common(self.FUZZY_CANDIDATES):
+            text = self.entry_texts[entry_id]
+            longest = max(len(text), len(query_text))
+            max_distance = int((1 - threshold) * longest + 1e-9)
+            distance = bounded_edit_distance(query_text, text, max_distance)
+            if distance is None:
+                continue
+
+            score = 1 - distance / longest
+            key = self.entry_keys[entry_id]
+            if key not in best or (-score, entry_id) < best[key]:
+                best[key] = (-score, entry_id)
+
+        ranked = sorted(best.items(), key=lambda item: item[1])
+        return [(key, -rank[0]) for key, rank in ranked[:limit]]
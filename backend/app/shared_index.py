@@ -0,0 +1,54 @@
+"""
+Similarity engine arrays shared read-only between worker processes.
+
+The normalized vectors, risk ordering, neighbour table and shared-skill
+table are written once as plain ``.npy`` files in a directory keyed by the
+catalog content hash. Every worker then maps them with ``mmap_mode="r"``,
+so the pages live once in the OS page cache instead of once per process.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# Bump whenever the array set or dtypes change; old directories are then ignored
+INDEX_VERSION = 2
+
+def index_path(cache_dir: Path, content_hash: str, backend: str, neighbors_k: int) -> Path:
+    """Index directory for one catalog version and engine configuration"""
+    return cache_dir / f"engine.{content_hash}.{backend}.k{neighbors_k}.v{INDEX_VERSION}"
+
+def write_index(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """Write the arrays as .npy files, publishing the directory atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=path.name + ".", dir=path.parent))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+        # mkdtemp creates 0700; workers running as another user must be able to read it
+        os.chmod(tmp_dir, 0o755)
+        os.rename(tmp_dir, path)
+    except OSError:
+        # Another worker published the same index first; theirs is identical
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not path.is_dir():
+            raise
+
+def read_index(path: Path, names: Iterable[str]) -> Optional[Dict[str, np.ndarray]]:
+    """Memory-map every named array, or None if the index is missing or incomplete"""
+    try:
+        return {name: np.load(path / f"{name}.npy", mmap_mode="r", allow_pickle=False) for name in names}
+    except (OSError, ValueError):
+        return None
+
+def prune_stale(cache_dir: Path, content_hash: str) -> None:
+    """Remove indexes built from other catalog versions.
+
+    Workers still mapping them keep their pages until they exit.
+    """
+    for stale_path in cache_dir.glob("engine.*"):
+        if stale_path.is_dir() and stale_path.name.split(".")[1] != content_hash:
+            shutil.rmtree(stale_path, ignore_errors=True)
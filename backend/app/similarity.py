@@ -1,43 +1,266 @@
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from pathlib import Path
 from typing import List, Dict
+from app.neighbors import create_backend
+from app.records import JobRecord
+from app.shared_index import index_path, read_index, write_index, prune_stale
+
+# Retraining estimate per skill in a gap
+RETRAINING_HOURS_PER_SKILL = 40
 
 class JobSimilarityEngine:
-    def __init__(self, data_loader):
+    # Query rows scored per matrix product when building the neighbour table
+    BLOCK_SIZE = 512
+
+    # Approximate backends propose this many candidates per requested neighbour
+    CANDIDATE_OVERSAMPLE = 10
+
+    # Catalog-sized arrays that can be memory-mapped from a shared index
+    SHARED_ARRAYS = (
+        "unit_vectors", "sorted_vectors",
+        "neighbor_rows", "neighbor_similarities", "skill_counts", "shared_skills",
+    )
+
+    def __init__(self, data_loader, neighbors_k: int = 10, backend: str = "exact",
+                 backend_options: Dict = None, shared_dir: str = None):
         self.data_loader = data_loader
+        self.neighbors_k = neighbors_k
+        self.backend_name = backend
+        self.backend_options = backend_options or {}
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self.source = None
+        self.build_index()
 
-    def find_similar_jobs(self, job_data: Dict, top_k: int = 5) -> List[Dict]:
-        """Find similar jobs with lower risk scores"""
-        current_vector = np.array(job_data["skill_vector"]).reshape(1, -1)
-        current_risk = job_data["risk_score"]
+    def build_index(self):
+        """Attach the shared index if one exists, otherwise build it (and publish it when sharing)"""
+        self.jobs = self.data_loader.get_all_jobs()
+        self.job_index = {job.title: i for i, job in enumerate(self.jobs)}
+        self.risk_scores = self.data_loader.risk_scores
+        # Rows in ascending risk order (the loader's risk index): the jobs safer
+        # than any risk score are then a prefix of sorted_vectors, found by
+        # binary search
+        self.risk_order = self.data_loader.risk_order
+        self.sorted_risks = self.data_loader.sorted_risks
+
+        if self.shared_dir is None:
+            self._build_arrays()
+            self.source = "built"
+            return
+
+        path = index_path(self.shared_dir, self.data_loader.content_hash, self.backend_name, self.neighbors_k)
+        arrays = read_index(path, self.SHARED_ARRAYS)
+        self.source = "shared"
+        if arrays is None:
+            self._build_arrays()
+            self.source = "built"
+            try:
+                write_index(path, {name: getattr(self, name) for name in self.SHARED_ARRAYS})
+                prune_stale(self.shared_dir, self.data_loader.content_hash)
+                # Swap the private copies for the mapped files
+                arrays = read_index(path, self.SHARED_ARRAYS)
+            except OSError:
+                pass  # Read-only filesystem: this process keeps its own arrays
+
+        if arrays is not None:
+            for name, array in arrays.items():
+                setattr(self, name, array)
+            self.backend = create_backend(self.backend_name, self.unit_vectors, **self.backend_options)
+
+    def _build_arrays(self):
+        """Build the normalized skill matrix, the neighbour backend and the top-k safer-neighbor table"""
+        self.unit_vectors = self._normalize(self.data_loader.skill_vectors)
+        self.backend = create_backend(self.backend_name, self.unit_vectors, **self.backend_options)
+
+        self.sorted_vectors = self.unit_vectors[self.risk_order]
+
+        # Top-k safer neighbours per job as catalog rows (-1 pads short lists),
+        # answered by lookup afterwards
+        job_count = len(self.jobs)
+        self.neighbor_rows = np.full((job_count, self.neighbors_k), -1, dtype=np.int32)
+        self.neighbor_similarities = np.zeros((job_count, self.neighbors_k), dtype=np.float64)
+        if self.neighbors_k > 0:
+            for i, ranked in enumerate(self._query_many(self.unit_vectors, self.jobs, self.neighbors_k)):
+                for rank, candidate in enumerate(ranked):
+                    self.neighbor_rows[i, rank] = self.job_index[candidate["title"]]
+                    self.neighbor_similarities[i, rank] = candidate["similarity"]
+
+        self.build_skill_gap_table()
+
+    def build_skill_gap_table(self):
+        """Precompute shared-skill counts for every job pair.
+
+        Sharing is symmetric, so only the strict upper triangle is stored,
+        condensed into one flat array; gap sizes in either direction follow
+        from it and each job's skill count.
+        """
+        skill_matrix = self.data_loader.skill_matrix.astype(np.float32)
+        job_count = len(skill_matrix)
+        self.skill_counts = skill_matrix.sum(axis=1).astype(np.uint16)
+        self.shared_skills = np.zeros(job_count * (job_count - 1) // 2, dtype=np.uint16)
+
+        # Blocks of rows through BLAS (counts are small integers, exact in
+        # float32); only each row's part right of the diagonal is kept
+        for start in range(0, job_count, self.BLOCK_SIZE):
+            block = skill_matrix[start:start + self.BLOCK_SIZE] @ skill_matrix.T
+            for offset, row in enumerate(block):
+                i = start + offset
+                if i < job_count - 1:
+                    position = self._pair_offset(i, i + 1, job_count)
+                    self.shared_skills[position:position + job_count - i - 1] = row[i + 1:]
+
+    @staticmethod
+    def _pair_offset(i: int, j: int, job_count: int) -> int:
+        """Position of pair (i, j), i < j, in the condensed triangle"""
+        return i * job_count - i * (i + 1) // 2 + (j - i - 1)
+
+    def shared_skill_count(self, job_a: JobRecord, job_b: JobRecord) -> int:
+        """Number of skills two catalog jobs have in common"""
+        i, j = sorted((job_a.index, job_b.index))
+        if i == j:
+            return int(self.skill_counts[i])
+        return int(self.shared_skills[self._pair_offset(i, j, len(self.skill_counts))])
+
+    def skill_gap_size(self, current_job: JobRecord, target_job: JobRecord) -> int:
+        """Number of target-job skills the current job lacks"""
+        return int(self.skill_counts[target_job.index]) - self.shared_skill_count(current_job, target_job)
 
-        all_jobs = self.data_loader.get_all_jobs()
-        candidates = []
+    def retraining_hours(self, current_job: JobRecord, target_job: JobRecord) -> int:
+        """Estimated hours to close the skill gap"""
+        return self.skill_gap_size(current_job, target_job) * RETRAINING_HOURS_PER_SKILL
 
-        for job in all_jobs:
-            if job["title"] == job_data["title"]:
-                continue
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Scale rows to unit length (zero rows stay zero, like sklearn)"""
+        vectors = np.atleast_2d(vectors)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
 
-            # Only suggest safer jobs
-            if job["risk_score"] >= current_risk:
-                continue
+    def _safer_count(self, risk_score: float) -> int:
+        """Number of catalog jobs strictly safer than risk_score (the prefix length)"""
+        return int(np.searchsorted(self.sorted_risks, risk_score, side="left"))
 
-            job_vector = np.array(job["skill_vector"]).reshape(1, -1)
-            similarity = cosine_similarity(current_vector, job_vector)[0][0]
+    def _rank_safer(self, candidates: np.ndarray, similarities: np.ndarray, job_data: JobRecord, top_k: int) -> List[Dict]:
+        """Rank the safer jobs among candidate rows by similarity, then risk reduction"""
+        current_risk = job_data.risk_score
 
-            candidates.append({
-                "title": job["title"],
-                "risk_score": job["risk_score"],
+        # Only suggest safer jobs (already true for a risk-sorted prefix)
+        keep = self.risk_scores[candidates] < current_risk
+        own_index = self.job_index.get(job_data.title)
+        if own_index is not None:
+            keep &= candidates != own_index
+
+        candidates = candidates[keep]
+        similarities = similarities[keep]
+        if len(candidates) == 0:
+            return []
+
+        # Rounding keeps float noise from the matrix product out of the ranking
+        ranking_similarity = np.round(similarities, 10)
+
+        # Narrow to the top_k by similarity with argpartition (plus anything tied
+        # with the k-th, so the tie-breaks below see every contender)
+        if len(candidates) > top_k:
+            kth = ranking_similarity[np.argpartition(-ranking_similarity, top_k - 1)[top_k - 1]]
+            contenders = ranking_similarity >= kth
+            candidates = candidates[contenders]
+            similarities = similarities[contenders]
+            ranking_similarity = ranking_similarity[contenders]
+
+        # Sort by similarity, then risk reduction (catalog order breaks ties)
+        reductions = current_risk - self.risk_scores[candidates]
+        order = np.lexsort((candidates, -reductions, -ranking_similarity))[:top_k]
+
+        ranked = []
+        for i, similarity in zip(candidates[order], similarities[order]):
+            job = self.jobs[i]
+            ranked.append({
+                "title": job.title,
+                "risk_score": job.risk_score,
                 "similarity": float(similarity),
-                "risk_reduction": current_risk - job["risk_score"]
+                "risk_reduction": current_risk - job.risk_score
+            })
+        return ranked
+
+    def _query_many(self, queries: np.ndarray, jobs: List[JobRecord], top_k: int) -> List[List[Dict]]:
+        """Safer neighbours for unit-length query rows via the configured backend"""
+        pool_size = top_k * self.CANDIDATE_OVERSAMPLE + 1
+        if not self.backend.approximate or pool_size >= len(self.jobs):
+            # Exact (also when the candidate pool would cover the catalog anyway).
+            # Queries go in risk order, so each block only needs the safer
+            # prefix of its riskiest query, and each row is cut to its own prefix.
+            results = [None] * len(queries)
+            query_order = np.argsort([job.risk_score for job in jobs], kind="stable")
+            for start in range(0, len(queries), self.BLOCK_SIZE):
+                positions = query_order[start:start + self.BLOCK_SIZE]
+                prefix = self._safer_count(jobs[positions[-1]].risk_score)
+                block = queries[positions] @ self.sorted_vectors[:prefix].T
+                for position, similarities in zip(positions, block):
+                    safer = self._safer_count(jobs[position].risk_score)
+                    results[position] = self._rank_safer(self.risk_order[:safer], similarities[:safer], jobs[position], top_k)
+            return results
+
+        return [self._query_approximate(query, job_data, top_k, pool_size) for query, job_data in zip(queries, jobs)]
+
+    def _query_approximate(self, query: np.ndarray, job_data: JobRecord, top_k: int, pool_size: int) -> List[Dict]:
+        """Score backend candidates exactly, falling back to brute force if too few are safer"""
+        candidates = self.backend.candidates(query, pool_size)
+        ranked = self._rank_safer(candidates, self.unit_vectors[candidates] @ query, job_data, top_k)
+
+        safer = self._safer_count(job_data.risk_score)
+        if len(ranked) < min(top_k, safer):
+            ranked = self._rank_safer(self.risk_order[:safer], self.sorted_vectors[:safer] @ query, job_data, top_k)
+        return ranked
+
+    def _table_neighbors(self, index: int, top_k: int) -> List[Dict]:
+        """Ranked safer neighbours of catalog row `index` from the lookup table"""
+        current_risk = self.jobs[index].risk_score
+        ranked = []
+        for i, similarity in zip(self.neighbor_rows[index, :top_k].tolist(), self.neighbor_similarities[index, :top_k].tolist()):
+            if i < 0:
+                break
+            job = self.jobs[i]
+            ranked.append({
+                "title": job.title,
+                "risk_score": job.risk_score,
+                "similarity": similarity,
+                "risk_reduction": current_risk - job.risk_score
             })
+        return ranked
+
+    def find_similar_jobs(self, job_data: JobRecord, top_k: int = 5) -> List[Dict]:
+        """Find similar jobs with lower risk scores"""
+        index = self.job_index.get(job_data.title)
+
+        if index is not None and top_k <= self.neighbors_k:
+            return self._table_neighbors(index, top_k)
+
+        # Jobs outside the catalog (or deeper queries) are ranked on the fly
+        query = self._normalize(np.array(job_data.skill_vector, dtype=float))
+        return self._query_many(query, [job_data], top_k)[0]
+
+    def find_similar_jobs_batch(self, jobs: List[JobRecord], top_k: int = 5) -> List[List[Dict]]:
+        """Find safer similar jobs for many jobs at once"""
+        results = [None] * len(jobs)
+        pending = []
+
+        for position, job_data in enumerate(jobs):
+            index = self.job_index.get(job_data.title)
+            if index is not None and top_k <= self.neighbors_k:
+                results[position] = self._table_neighbors(index, top_k)
+            else:
+                pending.append(position)
+
+        if pending:
+            # Table misses are scored together
+            queries = self._normalize(np.array([jobs[p].skill_vector for p in pending], dtype=float))
+            for position, ranked in zip(pending, self._query_many(queries, [jobs[p] for p in pending], top_k)):
+                results[position] = ranked
 
-        # Sort by similarity, then risk reduction
-        candidates.sort(key=lambda x: (x["similarity"], x["risk_reduction"]), reverse=True)
-        return candidates[:top_k]
+        return results
 
-    def calculate_skill_gap(self, current_job: Dict, target_job: Dict) -> List[str]:
-        """Identify skills to learn for pivot"""
-        current_skills = set(current_job["skills"])
-        target_skills = set(target_job["skills"])
-        return list(target_skills - current_skills)
+    def calculate_skill_gap(self, current_job: JobRecord, target_job: JobRecord) -> List[str]:
+        """Identify skills to learn for pivot, in the target job's skill order"""
+        gap_mask = target_job.skill_mask & ~current_job.skill_mask
+        skill_ids = self.data_loader.skill_ids
+        return [skill for skill in target_job.skills if gap_mask >> skill_ids[skill] & 1]
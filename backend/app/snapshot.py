@@ -0,0 +1,121 @@
+"""
+Compiled on-disk snapshot of the job catalog.
+
+The snapshot is an uncompressed NumPy ``.npz`` archive: numeric fields are
+stored as arrays, every string lives once in an interned string table, and
+list fields are flattened into id arrays plus row offsets. Loading it skips
+JSON parsing and validation entirely.
+"""
+import os
+import numpy as np
+from pathlib import Path
+from typing import Dict, List
+
+# Bump whenever the archive layout changes; old snapshots are then ignored
+SNAPSHOT_VERSION = 3
+
+# Ragged string-list fields and where they live in a job record
+LIST_FIELDS = {
+    "skills": ("skills",),
+    "tech_threats": ("tech_threats",),
+    "automatable": ("tasks", "automatable"),
+    "human_required": ("tasks", "human_required"),
+    "alternate_titles": ("alternate_titles",),
+}
+
+_SEPARATOR = "\x00"
+
+def snapshot_path(cache_dir: Path, stem: str, content_hash: str) -> Path:
+    """Snapshot file name, keyed by source content hash and layout version"""
+    return cache_dir / f"{stem}.{content_hash}.v{SNAPSHOT_VERSION}.npz"
+
+def _get_field(job: Dict, path: tuple) -> List[str]:
+    value = job
+    for part in path:
+        value = value.get(part, [])
+    return value
+
+def write_snapshot(path: Path, jobs: Dict[str, Dict]) -> None:
+    """Compile a validated catalog into a snapshot archive"""
+    strings = []
+    string_ids = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    keys = list(jobs)
+    arrays = {
+        "version": np.array(SNAPSHOT_VERSION),
+        "key_ids": np.array([intern(key) for key in keys], dtype=np.int32),
+        "title_ids": np.array([intern(jobs[key]["title"]) for key in keys], dtype=np.int32),
+        "onet_ids": np.array([intern(jobs[key]["onet_code"]) for key in keys], dtype=np.int32),
+        "risk_scores": np.array([jobs[key]["risk_score"] for key in keys], dtype=np.float64),
+        "skill_vectors": np.array([jobs[key]["skill_vector"] for key in keys], dtype=np.float64),
+        # NaN where the optional field is missing
+        "employment": np.array([jobs[key].get("employment", np.nan) for key in keys], dtype=np.float64),
+    }
+
+    for name, field_path in LIST_FIELDS.items():
+        ids = []
+        offsets = [0]
+        for key in keys:
+            ids.extend(intern(value) for value in _get_field(jobs[key], field_path))
+            offsets.append(len(ids))
+        arrays[f"{name}_ids"] = np.array(ids, dtype=np.int32)
+        arrays[f"{name}_offsets"] = np.array(offsets, dtype=np.int32)
+
+    arrays["strings"] = np.frombuffer(_SEPARATOR.join(strings).encode("utf-8"), dtype=np.uint8)
+
+    # Write to a temp file first so readers never see a partial archive
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+def read_snapshot(path: Path) -> Dict[str, Dict]:
+    """Rebuild the catalog dict from a snapshot archive"""
+    with np.load(path, allow_pickle=False) as archive:
+        if int(archive["version"]) != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot {path.name} has an unsupported layout version")
+
+        strings = archive["strings"].tobytes().decode("utf-8").split(_SEPARATOR)
+        keys = [strings[i] for i in archive["key_ids"].tolist()]
+        titles = archive["title_ids"].tolist()
+        onet_codes = archive["onet_ids"].tolist()
+        risk_scores = archive["risk_scores"].tolist()
+        skill_vectors = archive["skill_vectors"].tolist()
+        employment = archive["employment"].tolist()
+
+        lists = {}
+        for name in LIST_FIELDS:
+            ids = archive[f"{name}_ids"].tolist()
+            offsets = archive[f"{name}_offsets"].tolist()
+            lists[name] = [
+                [strings[i] for i in ids[offsets[row]:offsets[row + 1]]]
+                for row in range(len(keys))
+            ]
+
+    jobs = {}
+    for row, key in enumerate(keys):
+        jobs[key] = {
+            "title": strings[titles[row]],
+            "risk_score": risk_scores[row],
+            "onet_code": strings[onet_codes[row]],
+            "tasks": {
+                "automatable": lists["automatable"][row],
+                "human_required": lists["human_required"][row]
+            },
+            "skills": lists["skills"][row],
+            "tech_threats": lists["tech_threats"][row],
+            "skill_vector": skill_vectors[row]
+        }
+        # Optional fields, only present on jobs that define them
+        if lists["alternate_titles"][row]:
+            jobs[key]["alternate_titles"] = lists["alternate_titles"][row]
+        if not np.isnan(employment[row]):
+            jobs[key]["employment"] = int(employment[row])
+    return jobs
@@ -0,0 +1 @@
+# Backend benchmarks package
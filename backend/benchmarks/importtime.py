@@ -0,0 +1,70 @@
+"""
+Import-time digest for the API module.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter
+and summarizes the report: total import time, the slowest top-level
+packages (cumulative) and the slowest individual modules (self time).
+Catalog loading is not part of the import; it happens in warm_up(),
+which is timed separately.
+
+Run from the backend directory:
+    python -m benchmarks.importtime [--module app.main --top 15]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+def import_report(module: str) -> List[Tuple[int, int, int, str]]:
+    """(self_us, cumulative_us, depth, name) per imported module, in report order"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+def top_level_packages(rows: List[Tuple[int, int, int, str]]) -> Dict[str, int]:
+    """Cumulative microseconds per top-level package, from first-time imports"""
+    packages = {}
+    for self_us, _, _, name in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    rows = import_report(args.module)
+    total_us = sum(self_us for self_us, _, _, _ in rows)
+    print(f"import {args.module}: {total_us / 1000:.1f} ms across {len(rows)} modules")
+
+    print("\nSlowest packages (all their modules):")
+    packages = sorted(top_level_packages(rows).items(), key=lambda item: item[1], reverse=True)
+    for package, package_us in packages[:args.top]:
+        print(f"  {package_us / 1000:8.1f} ms  {package_us / total_us:6.1%}  {package}")
+
+    print("\nSlowest modules (self time):")
+    for self_us, _, _, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+    if args.module == "app.main":
+        from app import main as api
+
+        start = time.perf_counter()
+        api.warm_up()
+        print(f"\nwarm_up() after import: {(time.perf_counter() - start) * 1000:.1f} ms "
+              f"({len(api.data_loader.records)} jobs from {api.data_loader.source})")
+
+if __name__ == "__main__":
+    main()
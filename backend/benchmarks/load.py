@@ -0,0 +1,95 @@
+"""
+Concurrent load test against the API in-process.
+
+Drives the app through httpx's ASGITransport (no sockets) with --concurrency
+clients issuing --requests requests in total, mixing /analyze, /jobs,
+/suggest and full-catalog /analyze/batch calls like a burst of share-link
+traffic, and reports p50/p99 latency per endpoint. --cold disables the
+precomputed table and the LRU cache, so every analysis is computed; pass
+--offload-min-jobs 1 to push all of that through the compute executor.
+
+Run from the backend directory:
+    python -m benchmarks.load [--requests 2000 --concurrency 64 --executor thread --cold]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+async def run_load(app, titles: list, total: int, concurrency: int) -> dict:
+    import httpx
+
+    rng = random.Random(0)
+    requests = []
+    for _ in range(total):
+        roll = rng.random()
+        if roll < 0.67:
+            requests.append(("POST /analyze", "POST", "/analyze", {"job_title": rng.choice(titles)}))
+        elif roll < 0.7:
+            requests.append(("POST /analyze/batch", "POST", "/analyze/batch", {"job_titles": titles}))
+        elif roll < 0.85:
+            requests.append(("GET /jobs", "GET", "/jobs", None))
+        else:
+            requests.append(("GET /suggest", "GET", f"/suggest?q={rng.choice(titles)[:3]}", None))
+
+    latencies = {}
+    queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while not queue.empty():
+                name, method, path, body = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies["all"] = [sample for samples in latencies.values() for sample in samples]
+    return {"elapsed": elapsed, "latencies": latencies}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--executor", choices=["thread", "process", "inline"], default="thread")
+    parser.add_argument("--workers", type=int, default=0, help="compute pool size (0 = default)")
+    parser.add_argument("--offload-min-jobs", type=int, help="override COMPUTE_OFFLOAD_MIN_JOBS")
+    parser.add_argument("--cold", action="store_true", help="no precomputed table or cache")
+    args = parser.parse_args()
+
+    # Configuration is read when app.main is imported
+    os.environ["COMPUTE_EXECUTOR"] = args.executor
+    os.environ["COMPUTE_WORKERS"] = str(args.workers)
+    if args.offload_min_jobs is not None:
+        os.environ["COMPUTE_OFFLOAD_MIN_JOBS"] = str(args.offload_min_jobs)
+    if args.cold:
+        os.environ["PRECOMPUTE_ANALYSES"] = "0"
+        os.environ["ANALYSIS_CACHE_SIZE"] = "0"
+
+    from app import main as api
+
+    api.warm_up()
+    titles = [job.title for job in api.data_loader.get_all_jobs()]
+    result = asyncio.run(run_load(api.app, titles, args.requests, args.concurrency))
+
+    mode = "cold" if args.cold else "precomputed"
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {args.executor} executor, {mode} analyses")
+    print(f"throughput {args.requests / result['elapsed']:.0f} req/s")
+    for name, samples in sorted(result["latencies"].items()):
+        print(f"{name:>19}: n={len(samples):5d}  p50 {statistics.median(samples):7.2f} ms  "
+              f"p99 {percentile(samples, 0.99):7.2f} ms")
+
+if __name__ == "__main__":
+    main()
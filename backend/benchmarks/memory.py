@@ -0,0 +1,76 @@
+"""
+Per-worker memory with private vs shared (memory-mapped) similarity indexes.
+
+Starts --workers processes that each load a synthetic catalog and build a
+JobSimilarityEngine, either privately or by attaching to an index the parent
+built once (as gunicorn.conf.py does). Once every worker has touched its
+arrays, each reports RSS and PSS; PSS splits shared pages between the
+processes mapping them, so the PSS total is the real memory cost.
+
+Linux only (reads /proc/self/smaps_rollup). Run from the backend directory:
+    python -m benchmarks.memory [--workers 4 --jobs 10000 --dims 64]
+"""
+import argparse
+import multiprocessing
+import tempfile
+
+import numpy as np
+
+from app.similarity import JobSimilarityEngine
+from benchmarks.neighbors import load_synthetic
+
+def memory_kb() -> dict:
+    """Rss and Pss of the current process in kB"""
+    usage = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss"):
+                usage[name.lower()] = int(value.split()[0])
+    return usage
+
+def worker(data_dir: str, shared_dir: str, barrier, results) -> None:
+    from app.data_loader import DataLoader
+
+    engine = JobSimilarityEngine(DataLoader(data_dir, use_snapshot=False), shared_dir=shared_dir)
+    # Touch every page, as a long-running worker eventually would
+    for name in JobSimilarityEngine.SHARED_ARRAYS:
+        np.asarray(getattr(engine, name)).sum()
+
+    barrier.wait()
+    results.put(memory_kb())
+    barrier.wait()
+
+def run(mode: str, data_dir: str, shared_dir: str, workers: int) -> list:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(data_dir, shared_dir, barrier, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    usage = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return usage
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--dims", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir, tempfile.TemporaryDirectory() as shared_dir:
+        loader = load_synthetic(data_dir, args.jobs, args.dims, families=200)
+        # Built once up front, like gunicorn's on_starting hook
+        JobSimilarityEngine(loader, shared_dir=shared_dir)
+
+        print(f"Catalog: {args.jobs} jobs x {args.dims} dims, {args.workers} workers")
+        for mode, index_dir in (("private", None), ("shared", shared_dir)):
+            usage = run(mode, data_dir, index_dir, args.workers)
+            rss = sum(entry["rss"] for entry in usage) / 1024
+            pss = sum(entry["pss"] for entry in usage) / 1024
+            print(f"{mode:>8}: RSS per worker {rss / args.workers:7.1f} MB, PSS total {pss:7.1f} MB")
+
+if __name__ == "__main__":
+    main()
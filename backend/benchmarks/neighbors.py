@@ -0,0 +1,87 @@
+"""
+Recall vs latency of the safer-role neighbour backends.
+
+Builds a synthetic catalog whose skill vectors form occupation families
+(noisy copies of random cluster centres, like real job families), then times find_similar_jobs for a sample of
+jobs with each backend and reports recall@k against the exact results.
+hnsw is skipped when hnswlib is not installed.
+
+Run from the backend directory:
+    python -m benchmarks.neighbors [--jobs 10000 --dims 64 --families 200 --queries 200 --top-k 10]
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.data_loader import DataLoader
+from app.neighbors import hnswlib
+from app.similarity import JobSimilarityEngine
+from benchmarks.startup import synthetic_catalog
+
+def load_synthetic(tmp_dir: str, size: int, dims: int, families: int, seed: int = 0) -> DataLoader:
+    """DataLoader over a clustered synthetic catalog written to tmp_dir"""
+    template = DataLoader(use_snapshot=False)._create_sample_data()
+    jobs = synthetic_catalog(template, size, dims, seed)
+
+    rng = np.random.default_rng(seed)
+    centres = rng.random((families, dims))
+    vectors = centres[rng.integers(0, families, size)] + rng.normal(0, 0.05, (size, dims))
+    for job, vector in zip(jobs.values(), np.clip(vectors, 0, 1).round(3)):
+        job["skill_vector"] = vector.tolist()
+
+    processed_dir = Path(tmp_dir) / "processed"
+    processed_dir.mkdir()
+    (processed_dir / "jobs_normalized.json").write_text(json.dumps(jobs))
+    return DataLoader(tmp_dir, use_snapshot=False)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--dims", type=int, default=64)
+    parser.add_argument("--families", type=int, default=200, help="skill vector clusters")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        loader = load_synthetic(tmp_dir, args.jobs, args.dims, args.families)
+
+    queries = random.Random(0).sample(loader.get_all_jobs(), min(args.queries, args.jobs))
+    backends = ["exact", "lsh"] + (["hnsw"] if hnswlib is not None else [])
+
+    print(f"Catalog: {args.jobs} jobs x {args.dims} dims, {len(queries)} queries, top {args.top_k}")
+    if hnswlib is None:
+        print("(hnsw skipped: hnswlib is not installed)")
+
+    exact_titles = None
+    for name in backends:
+        start = time.perf_counter()
+        # neighbors_k=0 skips the lookup table so every query hits the backend
+        engine = JobSimilarityEngine(loader, neighbors_k=0, backend=name)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        samples = []
+        titles = []
+        for job in queries:
+            query_start = time.perf_counter()
+            similar = engine.find_similar_jobs(job, top_k=args.top_k)
+            samples.append((time.perf_counter() - query_start) * 1000)
+            titles.append({candidate["title"] for candidate in similar})
+
+        if exact_titles is None:
+            exact_titles = titles
+        found = sum(len(got & expected) for got, expected in zip(titles, exact_titles))
+        wanted = sum(len(expected) for expected in exact_titles)
+        recall = found / wanted if wanted else 1.0
+
+        print(f"{name:>6}: build {build_ms:8.1f} ms, query median {statistics.median(samples):.3f} ms, "
+              f"p99 {sorted(samples)[int(len(samples) * 0.99) - 1]:.3f} ms, recall@{args.top_k} {recall:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-request serialization cost for /analyze and /jobs.
+
+"before" mirrors the default FastAPI path: build a Pydantic model, validate
+it again against the response model, run jsonable_encoder and render with
+the standard JSONResponse. "after" is the current hot path: pre-encoded
+payload bytes (orjson when installed) sent through RawJSONResponse.
+
+Run from the backend directory:
+    python -m benchmarks.serialization [--repeat 2000]
+"""
+import argparse
+import asyncio
+import random
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app import main as api
+from app.models import JobRiskResponse
+from app.precompute import INTERNAL_FIELDS
+from app.responses import RawJSONResponse, orjson
+from benchmarks.startup import time_call
+
+def analyze_before(analysis: dict):
+    public = {field: value for field, value in analysis.items() if field not in INTERNAL_FIELDS}
+    model = JobRiskResponse(
+        **public,
+        automation_progress=round(min(analysis["raw_risk_score"] + random.uniform(-5, 10), 100), 1),
+        doom_message=random.choice(api.DOOM_MESSAGES[analysis["tier"]]).format(int(analysis["raw_risk_score"]))
+    )
+    validated = JobRiskResponse.model_validate(model.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+def analyze_after(job_key: str, analysis: dict):
+    return RawJSONResponse(api.flavored_payload(job_key, analysis)).body
+
+def jobs_before():
+    return JSONResponse(jsonable_encoder({"jobs": [job.title for job in api.data_loader.get_all_jobs()]})).body
+
+def jobs_after():
+    return RawJSONResponse(api.jobs_payload()).body
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--job-key", default="software_engineer")
+    args = parser.parse_args()
+
+    api.warm_up()
+    analysis = asyncio.run(api.get_static_analysis(args.job_key, 5, "bachelor"))
+    cases = {
+        "/analyze before": lambda: analyze_before(analysis),
+        "/analyze after": lambda: analyze_after(args.job_key, analysis),
+        "/jobs before": jobs_before,
+        "/jobs after": jobs_after,
+    }
+
+    print(f"Encoder: {'orjson' if orjson is not None else 'json (orjson not installed)'}")
+    for name, func in cases.items():
+        timing = time_call(func, args.repeat)
+        print(f"{name:>16}: median {timing['median_ms'] * 1000:.1f} us, best {timing['best_ms'] * 1000:.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Cold-start benchmark for the catalog loading paths.
+
+Compares rebuilding the built-in dict literal, parsing and validating
+jobs_normalized.json, and reading the compiled snapshot. Pass --jobs to
+time the JSON and snapshot paths on a synthetic catalog of that size.
+
+Run from the backend directory:
+    python -m benchmarks.startup [--repeat 50] [--jobs 10000 --dims 32]
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.data_loader import DataLoader, validate_jobs
+from app.snapshot import read_snapshot, write_snapshot
+
+def time_call(func, repeat: int) -> dict:
+    """Median and best wall time of a callable, in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "best_ms": min(samples)}
+
+def synthetic_catalog(template: dict, size: int, dims: int, seed: int = 0) -> dict:
+    """Clone the real catalog up to `size` jobs with random skill vectors"""
+    rng = random.Random(seed)
+    base_jobs = list(template.values())
+    jobs = {}
+    for i in range(size):
+        job = json.loads(json.dumps(base_jobs[i % len(base_jobs)]))
+        job["title"] = f"{job['title']} {i}"
+        job["risk_score"] = round(rng.uniform(0, 100), 1)
+        job["skill_vector"] = [round(rng.random(), 3) for _ in range(dims)]
+        jobs[f"job_{i}"] = job
+    return jobs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--jobs", type=int, help="benchmark a synthetic catalog of this many jobs")
+    parser.add_argument("--dims", type=int, default=5, help="skill vector length for --jobs")
+    args = parser.parse_args()
+
+    loader = DataLoader(args.data_dir, use_snapshot=False)
+    results = {"dict_literal": time_call(loader._create_sample_data, args.repeat)}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processed_path = Path(args.data_dir) / "processed" / "jobs_normalized.json"
+        if args.jobs:
+            processed_path = Path(tmp_dir) / "jobs_normalized.json"
+            processed_path.write_text(json.dumps(synthetic_catalog(loader._create_sample_data(), args.jobs, args.dims)))
+
+        def load_json():
+            jobs = json.loads(processed_path.read_bytes())
+            validate_jobs(jobs)
+            return jobs
+
+        cache_path = Path(tmp_dir) / "jobs_normalized.npz"
+        write_snapshot(cache_path, load_json())
+
+        results["json"] = time_call(load_json, args.repeat)
+        results["snapshot"] = time_call(lambda: read_snapshot(cache_path), args.repeat)
+
+        catalog_size = len(load_json())
+        json_bytes = processed_path.stat().st_size
+        snapshot_bytes = cache_path.stat().st_size
+
+    print(f"Catalog: {catalog_size} jobs, JSON {json_bytes} bytes, snapshot {snapshot_bytes} bytes")
+    print(f"(dict_literal always builds the {len(loader._create_sample_data())} built-in jobs)")
+    for name, timing in results.items():
+        print(f"{name:>12}: median {timing['median_ms']:.3f} ms, best {timing['best_ms']:.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Benchmark suite with JSON output for comparing commits.
+
+Three groups, each optional:
+
+* asgi     - endpoint latency in-process through httpx's ASGITransport:
+             /analyze (precomputed hit, computed miss, fuzzy title, 404),
+             /analyze/batch (full and slim), /jobs (all and filtered), /suggest, /stats, /groups, /skill-gap
+* uvicorn  - the same endpoints over HTTP against a local uvicorn process
+* micro    - DataLoader.search_job / query_jobs and JobSimilarityEngine.find_similar_jobs /
+             calculate_skill_gap on synthetic catalogs (50, 1k and 10k jobs)
+
+Run from the backend directory:
+    python -m benchmarks.suite [--out benchmark-results.json --groups asgi,micro --sizes 50,1000]
+    python -m benchmarks.suite --compare benchmark-results-base.json benchmark-results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List
+
+from benchmarks.load import percentile
+
+GROUPS = ("asgi", "uvicorn", "micro")
+
+# Compare flags a median this much slower than the baseline, ignoring
+# differences below timer noise
+REGRESSION_RATIO = 1.2
+REGRESSION_MIN_MS = 0.01
+
+def summarize(samples: List[float]) -> Dict:
+    """Latency summary of per-call samples in milliseconds"""
+    return {
+        "n": len(samples),
+        "median_ms": round(sorted(samples)[len(samples) // 2], 4),
+        "p99_ms": round(percentile(samples, 0.99), 4),
+        "mean_ms": round(sum(samples) / len(samples), 4),
+    }
+
+def measure(call: Callable, inputs: Iterable) -> Dict:
+    """Time call(value) for every input"""
+    samples = []
+    for value in inputs:
+        start = time.perf_counter()
+        call(value)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+async def measure_requests(client, requests: List[tuple], expected_status: int) -> Dict:
+    """Time sequential requests given as (method, path, json body)"""
+    samples = []
+    for method, path, body in requests:
+        start = time.perf_counter()
+        response = await client.request(method, path, json=body)
+        samples.append((time.perf_counter() - start) * 1000)
+        if response.status_code != expected_status:
+            raise RuntimeError(f"{method} {path}: expected {expected_status}, got {response.status_code}")
+    return summarize(samples)
+
+def typo_titles(loader, titles: List[str]) -> List[str]:
+    """Titles with a last-letter typo that only the fuzzy matcher resolves"""
+    typos = [title[:-1] + "x" for title in titles]
+    indexed = [typo for typo in typos if loader.find_job_key(typo, fuzzy=False)]
+    if indexed:
+        raise RuntimeError(f"Typo titles resolve without the fuzzy matcher: {indexed}")
+    # Short titles like "Chef" fall below the fuzzy threshold once misspelled
+    return [typo for typo in typos if loader.fuzzy_job_key(typo)]
+
+def endpoint_scenarios(titles: List[str], typos: List[str], repeat: int, seed: int = 0) -> Dict[str, tuple]:
+    """Scenario name -> (requests, expected status); shared by both transports"""
+    rng = random.Random(seed)
+    picks = [rng.choice(titles) for _ in range(repeat)]
+    typo_picks = [rng.choice(typos) for _ in range(repeat)]
+    pairs = [(rng.choice(titles), rng.choice(titles)) for _ in range(repeat)]
+    return {
+        "analyze_hit": ([("POST", "/analyze", {"job_title": title}) for title in picks], 200),
+        "analyze_fuzzy": ([("POST", "/analyze", {"job_title": typo}) for typo in typo_picks], 200),
+        "analyze_404": ([("POST", "/analyze", {"job_title": f"Zorblax {i}"}) for i in range(repeat)], 404),
+        "batch_full": ([("POST", "/analyze/batch", {"job_titles": titles[:50]})] * max(repeat // 10, 1), 200),
+        "batch_slim": ([("POST", "/analyze/batch", {"job_titles": titles[:50], "slim": True})] * max(repeat // 10, 1), 200),
+        "jobs": ([("GET", "/jobs", None)] * repeat, 200),
+        "jobs_filtered": ([("GET", "/jobs?tier=high&sort=-risk&limit=20", None)] * repeat, 200),
+        "suggest": ([("GET", f"/suggest?q={title[:3]}", None) for title in picks], 200),
+        "stats": ([("GET", "/stats", None)] * repeat, 200),
+        "groups": ([("GET", "/groups?level=minor", None)] * repeat, 200),
+        "group_detail": ([("GET", "/groups/29-0000", None)] * repeat, 200),
+        "skill_gap": ([("GET", f"/skill-gap?from={a}&to={b}", None) for a, b in pairs], 200),
+    }
+
+async def run_endpoints(client, titles: List[str], typos: List[str], repeat: int) -> Dict:
+    results = {}
+    for name, (requests, status) in endpoint_scenarios(titles, typos, repeat).items():
+        results[name] = await measure_requests(client, requests, status)
+    return results
+
+def bench_asgi(repeat: int) -> Dict:
+    """Endpoint latency in-process; the miss scenario bypasses the table and cache"""
+    import httpx
+    from app import main as api
+    from app.cache import LRUCache
+
+    api.warm_up()
+    titles = [job.title for job in api.data_loader.get_all_jobs()]
+    typos = typo_titles(api.data_loader, titles)
+
+    async def run():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            results = await run_endpoints(client, titles, typos, repeat)
+
+            table, cache = api.analysis_table, api.analysis_cache
+            api.analysis_table, api.analysis_cache = None, LRUCache(max_size=0)
+            try:
+                requests, status = endpoint_scenarios(titles, typos, repeat)["analyze_hit"]
+                results["analyze_miss"] = await measure_requests(client, requests, status)
+            finally:
+                api.analysis_table, api.analysis_cache = table, cache
+            return results
+
+    return asyncio.run(run())
+
+def bench_uvicorn(repeat: int) -> Dict:
+    """Endpoint latency over HTTP against a local uvicorn process (default config)"""
+    import httpx
+    from app.data_loader import DataLoader
+
+    # Same catalog and threshold the server loads, to pick the typo titles
+    loader = DataLoader(fuzzy_threshold=float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.8")))
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                if httpx.get(f"{base_url}/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline or server.poll() is not None:
+                raise RuntimeError("uvicorn did not become healthy")
+            time.sleep(0.1)
+
+        async def run():
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                titles = (await client.get("/jobs")).json()["jobs"]
+                return await run_endpoints(client, titles, typo_titles(loader, titles), repeat)
+
+        return asyncio.run(run())
+    finally:
+        server.terminate()
+        server.wait()
+
+def bench_micro(sizes: List[int], repeat: int) -> Dict:
+    """Core lookups on synthetic catalogs of each size"""
+    from app.similarity import JobSimilarityEngine
+    from benchmarks.neighbors import load_synthetic
+
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            loader = load_synthetic(tmp_dir, size, dims=16, families=max(size // 50, 2))
+
+        start = time.perf_counter()
+        engine = JobSimilarityEngine(loader)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(0)
+        jobs = loader.get_all_jobs()
+        picks = [rng.choice(jobs) for _ in range(repeat)]
+        pairs = [(rng.choice(jobs), rng.choice(jobs)) for _ in range(repeat)]
+
+        results[str(size)] = {
+            "engine_build": {"n": 1, "median_ms": round(build_ms, 4)},
+            "search_job_exact": measure(loader.search_job, [job.title for job in picks]),
+            "search_job_fuzzy": measure(loader.search_job, [job.title[:-1] + "x" for job in picks]),
+            "query_jobs_page": measure(
+                lambda low: loader.query_jobs(min_risk=low, max_risk=low + 20, sort="-risk", limit=50),
+                [rng.uniform(0, 80) for _ in range(repeat)]
+            ),
+            "find_similar_jobs": measure(lambda job: engine.find_similar_jobs(job, top_k=3), picks),
+            # Deeper than the neighbour table: ranked on the fly
+            "find_similar_jobs_uncached": measure(lambda job: engine.find_similar_jobs(job, top_k=engine.neighbors_k + 5), picks),
+            "calculate_skill_gap": measure(lambda pair: engine.calculate_skill_gap(*pair), pairs),
+        }
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    """Dotted scenario name -> median_ms"""
+    flat = {}
+    for name, value in results.items():
+        if isinstance(value, dict) and "median_ms" in value:
+            flat[prefix + name] = value["median_ms"]
+        elif isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{name}."))
+    return flat
+
+def compare(baseline_path: str, current_path: str) -> int:
+    """Print median changes between two result files; non-zero exit on regressions"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(current_path) as f:
+        current = json.load(f)
+
+    old = flatten(baseline["results"])
+    new = flatten(current["results"])
+    print(f"{baseline['meta']['commit']} -> {current['meta']['commit']} (median ms)")
+
+    regressions = 0
+    for name in sorted(old.keys() & new.keys()):
+        ratio = new[name] / old[name] if old[name] else 1.0
+        slower = ratio > REGRESSION_RATIO and new[name] - old[name] > REGRESSION_MIN_MS
+        flag = "  REGRESSION" if slower else ""
+        regressions += bool(flag)
+        print(f"{name:<50} {old[name]:10.3f} {new[name]:10.3f} {ratio:7.2f}x{flag}")
+    for name in sorted(new.keys() - old.keys()):
+        print(f"{name:<50} {'-':>10} {new[name]:10.3f}   (new)")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="benchmark-results.json")
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"comma-separated subset of {', '.join(GROUPS)}")
+    parser.add_argument("--sizes", default="50,1000,10000", help="synthetic catalog sizes for micro")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"))
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare))
+
+    groups = [group.strip() for group in args.groups.split(",") if group.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    # Stable flavor keeps payload sizes comparable between runs
+    os.environ.setdefault("DOOM_FLAVOR_MODE", "seeded")
+
+    results = {}
+    if "asgi" in groups:
+        results["asgi"] = bench_asgi(args.repeat)
+    if "uvicorn" in groups:
+        results["uvicorn"] = bench_uvicorn(args.repeat)
+    if "micro" in groups:
+        results["micro"] = bench_micro([int(size) for size in args.sizes.split(",")], args.repeat)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for name, median_ms in flatten(results).items():
+        print(f"{name:<50} {median_ms:10.3f} ms")
+    print(f"Wrote {args.out}")
+
+if __name__ == "__main__":
+    main()
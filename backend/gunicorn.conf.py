@@ -0,0 +1,51 @@
+"""
+Gunicorn settings for multi-worker deployments (opt-in; the Procfile runs a
+single Uvicorn process):
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+The master process builds the similarity index and the precomputed analysis
+table once, before forking. Each Uvicorn worker then memory-maps the index
+read-only and loads the analyses from disk instead of rebuilding them, so
+adding workers adds little memory for the catalog.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# Fixed default: cpu_count() reports the host's cores inside containers, and
+# every worker still holds its own records, title index and analysis table
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+# Workers import the app after forking. preload_app would share the arrays
+# only until copy-on-write kicks in; mapped files stay shared for good.
+os.environ.setdefault("SHARED_INDEX_DIR", "data/cache")
+os.environ.setdefault("PRECOMPUTED_ANALYSES_PATH", "data/cache/analyses.json")
+
+def on_starting(server):
+    """Publish the shared index and analysis table before any worker starts"""
+    from pathlib import Path
+
+    from app.data_loader import DataLoader
+    from app.precompute import AnalysisTable, table_key
+    from app.similarity import JobSimilarityEngine
+
+    data_loader = DataLoader(
+        fuzzy_threshold=float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.8")),
+        use_snapshot=os.getenv("CATALOG_SNAPSHOT", "0") == "1"
+    )
+    similarity_engine = JobSimilarityEngine(
+        data_loader,
+        backend=os.getenv("NEIGHBOR_BACKEND", "exact"),
+        shared_dir=os.environ["SHARED_INDEX_DIR"]
+    )
+    server.log.info(f"Similarity index {similarity_engine.source} for catalog {data_loader.content_hash}")
+
+    if os.getenv("PRECOMPUTE_ANALYSES", "1") != "0":
+        table_path = Path(os.environ["PRECOMPUTED_ANALYSES_PATH"])
+        if AnalysisTable.load(table_path, table_key(data_loader, similarity_engine)) is None:
+            try:
+                AnalysisTable.build(data_loader, similarity_engine).save(table_path)
+            except OSError:
+                pass  # Read-only filesystem: each worker builds its own table
@@ -7,12 +7,14 @@ import requests
 import plotly.graph_objects as go
 import plotly.express as px
 import os
+import json
 
 # Import components
-from components.config import API_URL, UI_ELEMENTS, COLORS, FONTS, SIZES
+from components.config import UI_ELEMENTS, COLORS, FONTS, SIZES, TIER_COLORS, get_risk_tier
 from components.styles import get_css_styles
 from components.doom_meter import create_doom_meter
 from components.resources import create_resources_section, create_data_sources_footer
+from components import api_client
 
 # Alias for backward compatibility
 ICONS = UI_ELEMENTS
@@ -62,19 +64,14 @@ with st.sidebar:
     
     # Fetch job list from API
     try:
-        jobs_response = requests.get(f"{API_URL}/jobs", timeout=5)
-        if jobs_response.status_code == 200:
-            jobs_data = jobs_response.json()
-            jobs_list = jobs_data.get("jobs", [])
+        jobs_list = api_client.fetch_jobs()
             
-            # Display in columns for better readability
-            st.markdown('<div style="font-size: 0.85em; line-height: 1.4;">', unsafe_allow_html=True)
-            for job in sorted(jobs_list):
-                st.markdown(f"- {job}")
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown("- Software Engineer\n- Registered Nurse\n- Data Analyst\n- Accountant\n- Teacher\n- Plus 18 more...")
-    except:
+        # Display in columns for better readability
+        st.markdown('<div style="font-size: 0.85em; line-height: 1.4;">', unsafe_allow_html=True)
+        for job in sorted(jobs_list):
+            st.markdown(f"- {job}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    except requests.exceptions.RequestException:
         st.markdown("- Software Engineer\n- Registered Nurse\n- Data Analyst\n- Accountant\n- Teacher\n- Plus 18 more...")
 
     st.markdown("---")
@@ -124,10 +121,8 @@ with st.sidebar:
 # Fetch available jobs for autocomplete
 available_jobs = []
 try:
-    jobs_response = requests.get(f"{API_URL}/jobs", timeout=3)
-    if jobs_response.status_code == 200:
-        available_jobs = sorted(jobs_response.json().get("jobs", []))
-except:
+    available_jobs = sorted(api_client.fetch_jobs())
+except requests.exceptions.RequestException:
     # Fallback list if API is unavailable
     available_jobs = [
         "Software Engineer", "Data Analyst", "Registered Nurse", "Accountant", 
@@ -163,9 +158,12 @@ with col1:
         
         # Show suggestions as you type
         if job_title:
-            matches = [job for job in available_jobs if job_title.lower() in job.lower()]
-            if matches and len(matches) <= 5:
-                st.caption(f"Did you mean: {', '.join(matches[:5])}")
+            try:
+                matches = api_client.fetch_suggestions(job_title, limit=5)
+            except requests.exceptions.RequestException:
+                matches = [job for job in available_jobs if job_title.lower() in job.lower()][:5]
+            if matches:
+                st.caption(f"Did you mean: {', '.join(matches)}")
 
 with col2:
     st.markdown("<br>", unsafe_allow_html=True)
@@ -174,25 +172,16 @@ with col2:
 if analyze_btn and job_title: 
     with st.spinner("Consulting robot underlords..."):
         try:
-            response = requests.post(
-                f"{API_URL}/analyze",
-                json={"job_title": job_title}
-            )
+            response = api_client.analyze_job(job_title)
 
             if response.status_code == 200:
                 data = response.json()
 
                 # Doom Score Display - brutalist style
                 risk = data["risk_score"]
-                if risk > 60:
-                    doom_class = "doom-high"
-                    doom_icon = "[!]"
-                elif risk > 35:
-                    doom_class = "doom-medium"
-                    doom_icon = "[WARNING]"
-                else:
-                    doom_class = "doom-low"
-                    doom_icon = "[OK]"
+                risk_tier = get_risk_tier(risk)
+                doom_class = f"doom-{risk_tier}"
+                doom_icon = {"high": "[!]", "medium": "[WARNING]", "low": "[OK]"}[risk_tier]
 
                 st.markdown(f"""
                 <div class="big-doom {doom_class}">
@@ -439,20 +428,20 @@ if analyze_btn and job_title:
 
             elif response.status_code == 404:
                 st.warning(f"Job not found: **{job_title}**")
-                st.info("Try one of these available jobs:")
+                # Backend suggests the closest titles for typos
+                st.info(response.json().get("detail", "Try one of these available jobs:"))
+                st.caption("All available jobs:")
                 
                 # Fetch and display available jobs
                 try:
-                    jobs_response = requests.get(f"{API_URL}/jobs", timeout=3)
-                    if jobs_response.status_code == 200:
-                        jobs_list = jobs_response.json().get("jobs", [])
+                    jobs_list = api_client.fetch_jobs()
                         
-                        # Display in 3 columns
-                        cols = st.columns(3)
-                        for idx, job in enumerate(sorted(jobs_list)):
-                            with cols[idx % 3]:
-                                st.markdown(f"- {job}")
-                except:
+                    # Display in 3 columns
+                    cols = st.columns(3)
+                    for idx, job in enumerate(sorted(jobs_list)):
+                        with cols[idx % 3]:
+                            st.markdown(f"- {job}")
+                except requests.exceptions.RequestException:
                     st.markdown("- Software Engineer\n- Registered Nurse\n- Data Analyst")
             else:
                 error_detail = response.json().get('detail', 'Unknown error')
@@ -478,52 +467,50 @@ with tab2:
     # Skill Gap Calculator
     st.markdown("### **SKILL GAP CALCULATOR**")
 
-    target_role = st.selectbox(
-        "**Choose your target career:**",
-        ["UX Researcher", "Data Analyst", "Product Manager", "AI Ethics Specialist", "Software Engineer", "Digital Marketing Specialist"],
-        help="Select the career you want to pivot to"
-    )
+    col_from, col_to = st.columns(2)
+    with col_from:
+        current_role = st.selectbox(
+            "**Your current job:**",
+            available_jobs,
+            help="Select the job you have today"
+        )
+    with col_to:
+        target_role = st.selectbox(
+            "**Choose your target career:**",
+            available_jobs,
+            index=available_jobs.index("Data Analyst") if "Data Analyst" in available_jobs else 0,
+            help="Select the career you want to pivot to"
+        )
 
     if target_role:
-        # Mock skill gap analysis (in real implementation, this would come from backend)
-        skill_gaps = {
-            "UX Researcher": {
-                "current_skills": ["Communication", "Problem Solving", "Basic Research"],
-                "target_skills": ["User Research Methods", "UX Design Principles", "Data Analysis", "Prototyping", "Usability Testing"],
-                "gap_skills": ["User Research Methods", "UX Design Principles", "Prototyping"],
-                "gap_percentage": 60
-            },
-            "Data Analyst": {
-                "current_skills": ["Basic Math", "Excel", "Problem Solving"],
-                "target_skills": ["Python Programming", "SQL", "Statistics", "Data Visualization", "Machine Learning Basics"],
-                "gap_skills": ["Python Programming", "SQL", "Statistics", "Data Visualization"],
-                "gap_percentage": 80
-            },
-            "Product Manager": {
-                "current_skills": ["Communication", "Leadership", "Problem Solving"],
-                "target_skills": ["Product Strategy", "Market Analysis", "Agile Methodology", "User Stories", "Roadmapping"],
-                "gap_skills": ["Product Strategy", "Agile Methodology", "Roadmapping"],
-                "gap_percentage": 60
-            }
-        }
-
-        gap_data = skill_gaps.get(target_role, skill_gaps["UX Researcher"])
-
-        st.markdown(f"** Skill Gap Analysis for {target_role}:**")
-        st.progress(gap_data["gap_percentage"] / 100)
-        st.caption(f"Gap: {gap_data['gap_percentage']}% - You need to learn {len(gap_data['gap_skills'])} new skills")
+        # Skill gap analysis from the backend
+        gap_data = None
+        try:
+            gap_data = api_client.fetch_skill_gap(current_role, target_role)
+        except requests.exceptions.RequestException:
+            pass
+
+        if gap_data:
+            st.markdown(f"** Skill Gap Analysis: {current_role} to {target_role}:**")
+            st.progress(gap_data["gap_percentage"] / 100)
+            st.caption(
+                f"Gap: {gap_data['gap_percentage']:.0f}% - You need to learn {len(gap_data['gap_skills'])} new skills "
+                f"(about {gap_data['retraining_hours']} hours of retraining)"
+            )
 
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown("** Your Current Skills:**")
-            for skill in gap_data["current_skills"]:
-                st.markdown(f"- {skill}")
+            with col1:
+                st.markdown("** Your Current Skills:**")
+                for skill in gap_data["current_skills"]:
+                    st.markdown(f"- {skill}")
 
-        with col2:
-            st.markdown(f"**Skills to Learn for {target_role}:**")
-            for skill in gap_data["gap_skills"]:
-                st.markdown(f"- {skill}")
+            with col2:
+                st.markdown(f"**Skills to Learn for {target_role}:**")
+                for skill in gap_data["gap_skills"]:
+                    st.markdown(f"- {skill}")
+        else:
+            st.warning("Skill gap data is unavailable right now. The backend may be starting up.")
 
         st.markdown("---")
         st.markdown("### RETRAINING PROGRAMS")
@@ -840,235 +827,359 @@ with tab4:
     
     st.markdown("---")
     
-    # Fetch all jobs and calculate aggregate metrics
+    # Fetch precomputed aggregate metrics
     try:
-        jobs_response = requests.get(f"{API_URL}/jobs", timeout=5)
-        if jobs_response.status_code == 200:
-            all_jobs = jobs_response.json().get("jobs", [])
+        try:
+            stats = api_client.fetch_stats()
+        except requests.exceptions.HTTPError as e:
+            # Only a backend without /stats falls back; timeouts and 5xx mean it is
+            # already struggling and must not get one /analyze call per job on top
+            if e.response is None or e.response.status_code != 404:
+                raise
+            # Score every job concurrently, showing the index as it fills in
+            job_titles = api_client.fetch_jobs()
+            progress = st.progress(0.0, text="Scanning professions...")
+            running_index = st.empty()
+            risk_scores = {}
+            for done, (title, risk_score) in enumerate(api_client.iter_risk_scores(job_titles), start=1):
+                if risk_score is not None:
+                    risk_scores[title] = risk_score
+                progress.progress(done / len(job_titles), text=f"Scanned {done}/{len(job_titles)} professions")
+                if risk_scores:
+                    running_index.markdown(
+                        f"**Running index:** {sum(risk_scores.values()) / len(risk_scores):.1f}% "
+                        f"across {len(risk_scores)} professions"
+                    )
+            progress.empty()
+            running_index.empty()
+            stats = api_client.summarize_risks(risk_scores)
+
+        # Ranked (highest risk first) by the backend
+        job_risks = [
+            {"job": r["job_title"], "risk": r["risk_score"], "tier": r["tier"]}
+            for r in stats.get("ranked_jobs", [])
+        ]
+        
+        if job_risks:
+            # Aggregate metrics
+            avg_risk = stats["average_risk"]
+            high_risk_count = stats["tier_counts"]["high"]
+            medium_risk_count = stats["tier_counts"]["medium"]
+            low_risk_count = stats["tier_counts"]["low"]
             
-            # Get risk scores for all jobs
-            job_risks = []
-            for job in all_jobs:
-                try:
-                    response = requests.post(f"{API_URL}/analyze", json={"job_title": job}, timeout=3)
-                    if response.status_code == 200:
-                        job_risks.append({
-                            "job": response.json()["job_title"],
-                            "risk": response.json()["risk_score"]
-                        })
-                except:
-                    continue
+            # Display humanity doom score
+            st.markdown(f"""
+            <div style="text-align: center; padding: 40px; background: {COLORS['bg_panel']}; border: 5px solid {COLORS['border_heavy']}; margin: 20px 0; box-shadow: 12px 12px 0px {COLORS['shadow']};">
+                <h1 style="font-family: {FONTS['heading']}; font-size: 4em; margin: 0; color: {COLORS['primary_red']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                    {avg_risk:.1f}%
+                </h1>
+                <h2 style="font-family: {FONTS['heading']}; font-size: 1.8em; margin-top: 15px; color: {COLORS['text_primary']}; text-transform: uppercase;">
+                    HUMANITY AUTOMATION INDEX
+                </h2>
+                <p style="font-family: {FONTS['primary']}; font-size: 1.2em; margin-top: 20px; color: {COLORS['text_secondary']};">
+                    Average automation risk across {len(job_risks)} professions
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
             
-            if job_risks:
-                # Calculate aggregate metrics
-                avg_risk = sum(r["risk"] for r in job_risks) / len(job_risks)
-                high_risk_count = sum(1 for r in job_risks if r["risk"] > 60)
-                medium_risk_count = sum(1 for r in job_risks if 35 < r["risk"] <= 60)
-                low_risk_count = sum(1 for r in job_risks if r["risk"] <= 35)
-                
-                # Display humanity doom score
+            # Interpretation
+            st.markdown("### THE VERDICT")
+            
+            if avg_risk > 60:
+                interpretation = "CRITICAL"
+                color = COLORS['primary_red']
+                message = "Humanity is in the danger zone. Most jobs face significant automation risk. Time to adapt or perish."
+            elif avg_risk > 40:
+                interpretation = "CONCERNING"
+                color = COLORS['warning_orange']
+                message = "We're at the tipping point. Automation is accelerating across industries. Preparation is essential."
+            else:
+                interpretation = "MANAGEABLE"
+                color = COLORS['success_green']
+                message = "Many jobs remain safe for now, but the trajectory is clear. Stay vigilant and keep learning."
+            
+            st.markdown(f"""
+            <div style="padding: 25px; background: {COLORS['bg_secondary']}; border: 4px solid {color}; margin: 20px 0;">
+                <h3 style="color: {color}; font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
+                    STATUS: {interpretation}
+                </h3>
+                <p style="font-family: {FONTS['primary']}; color: {COLORS['text_primary']}; font-size: 1.1em; line-height: 1.6;">
+                    {message}
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Risk distribution
+            st.markdown("### RISK DISTRIBUTION")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    "HIGH RISK",
+                    f"{high_risk_count} jobs",
+                    f"{(high_risk_count/len(job_risks)*100):.0f}%",
+                    help="Jobs with 60%+ automation risk"
+                )
+            
+            with col2:
+                st.metric(
+                    "MEDIUM RISK",
+                    f"{medium_risk_count} jobs",
+                    f"{(medium_risk_count/len(job_risks)*100):.0f}%",
+                    help="Jobs with 35-60% automation risk"
+                )
+            
+            with col3:
+                st.metric(
+                    "LOW RISK",
+                    f"{low_risk_count} jobs",
+                    f"{(low_risk_count/len(job_risks)*100):.0f}%",
+                    help="Jobs with <35% automation risk"
+                )
+            
+            # Chart of all jobs
+            st.markdown("### ALL PROFESSIONS RANKED")
+            
+            # Already sorted by risk
+            sorted_risks = job_risks
+            
+            # Create bar chart
+            import plotly.graph_objects as go
+            
+            colors = [TIER_COLORS[r["tier"]] for r in sorted_risks]
+            
+            fig = go.Figure(data=[
+                go.Bar(
+                    x=[r["risk"] for r in sorted_risks],
+                    y=[r["job"] for r in sorted_risks],
+                    orientation='h',
+                    marker=dict(color=colors, line=dict(color='#000000', width=2)),
+                    text=[f'{r["risk"]:.1f}%' for r in sorted_risks],
+                    textposition='outside',
+                )
+            ])
+            
+            fig.update_layout(
+                title="Automation Risk by Profession",
+                xaxis_title="Automation Risk (%)",
+                yaxis_title="",
+                height=1200,
+                showlegend=False,
+                plot_bgcolor=COLORS['bg_primary'],
+                paper_bgcolor=COLORS['bg_panel'],
+                font=dict(family=FONTS['primary'], size=11, color=COLORS['text_primary']),
+                title_font=dict(family=FONTS['heading'], size=20, color=COLORS['text_primary']),
+                xaxis=dict(range=[0, 100], gridcolor=COLORS['border_heavy']),
+                margin=dict(l=200, r=100, t=60, b=40)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Two perspectives
+            st.markdown("---")
+            col_doom, col_hope = st.columns(2)
+            
+            with col_doom:
                 st.markdown(f"""
-                <div style="text-align: center; padding: 40px; background: {COLORS['bg_panel']}; border: 5px solid {COLORS['border_heavy']}; margin: 20px 0; box-shadow: 12px 12px 0px {COLORS['shadow']};">
-                    <h1 style="font-family: {FONTS['heading']}; font-size: 4em; margin: 0; color: {COLORS['primary_red']}; text-transform: uppercase; letter-spacing: 0.05em;">
-                        {avg_risk:.1f}%
-                    </h1>
-                    <h2 style="font-family: {FONTS['heading']}; font-size: 1.8em; margin-top: 15px; color: {COLORS['text_primary']}; text-transform: uppercase;">
-                        HUMANITY AUTOMATION INDEX
-                    </h2>
-                    <p style="font-family: {FONTS['primary']}; font-size: 1.2em; margin-top: 20px; color: {COLORS['text_secondary']};">
-                        Average automation risk across {len(job_risks)} professions
+                <div style="padding: 20px; background: {COLORS['primary_red']}; color: {COLORS['text_white']}; border: 4px solid {COLORS['border_heavy']}; box-shadow: 6px 6px 0px {COLORS['shadow']};">
+                    <h3 style="font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
+                        DOOM PERSPECTIVE
+                    </h3>
+                    <p style="font-family: {FONTS['primary']}; line-height: 1.6;">
+                        At {avg_risk:.1f}% average automation, we're accelerating toward mass job displacement. 
+                        {high_risk_count} professions face critical risk. Without intervention, economic chaos awaits.
+                    </p>
+                    <p style="font-family: {FONTS['primary']}; margin-top: 15px; font-weight: 700;">
+                        Path: Universal Basic Income or societal collapse.
                     </p>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                # Interpretation
-                st.markdown("### THE VERDICT")
-                
-                if avg_risk > 60:
-                    interpretation = "CRITICAL"
-                    color = COLORS['primary_red']
-                    message = "Humanity is in the danger zone. Most jobs face significant automation risk. Time to adapt or perish."
-                elif avg_risk > 40:
-                    interpretation = "CONCERNING"
-                    color = COLORS['warning_orange']
-                    message = "We're at the tipping point. Automation is accelerating across industries. Preparation is essential."
-                else:
-                    interpretation = "MANAGEABLE"
-                    color = COLORS['success_green']
-                    message = "Many jobs remain safe for now, but the trajectory is clear. Stay vigilant and keep learning."
-                
+            
+            with col_hope:
                 st.markdown(f"""
-                <div style="padding: 25px; background: {COLORS['bg_secondary']}; border: 4px solid {color}; margin: 20px 0;">
-                    <h3 style="color: {color}; font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
-                        STATUS: {interpretation}
+                <div style="padding: 20px; background: {COLORS['success_green']}; color: {COLORS['text_white']}; border: 4px solid {COLORS['border_heavy']}; box-shadow: 6px 6px 0px {COLORS['shadow']};">
+                    <h3 style="font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
+                        OPTIMIST PERSPECTIVE
                     </h3>
-                    <p style="font-family: {FONTS['primary']}; color: {COLORS['text_primary']}; font-size: 1.1em; line-height: 1.6;">
-                        {message}
+                    <p style="font-family: {FONTS['primary']}; line-height: 1.6;">
+                        {low_risk_count} professions remain highly human-centric. Automation frees us from drudgery. 
+                        We're headed for permanent vacation - if we plan wisely.
+                    </p>
+                    <p style="font-family: {FONTS['primary']}; margin-top: 15px; font-weight: 700;">
+                        Path: Renaissance of creativity, care, and meaning.
                     </p>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                # Risk distribution
-                st.markdown("### RISK DISTRIBUTION")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric(
-                        "HIGH RISK",
-                        f"{high_risk_count} jobs",
-                        f"{(high_risk_count/len(job_risks)*100):.0f}%",
-                        help="Jobs with 60%+ automation risk"
-                    )
-                
-                with col2:
-                    st.metric(
-                        "MEDIUM RISK",
-                        f"{medium_risk_count} jobs",
-                        f"{(medium_risk_count/len(job_risks)*100):.0f}%",
-                        help="Jobs with 35-60% automation risk"
-                    )
-                
-                with col3:
-                    st.metric(
-                        "LOW RISK",
-                        f"{low_risk_count} jobs",
-                        f"{(low_risk_count/len(job_risks)*100):.0f}%",
-                        help="Jobs with <35% automation risk"
-                    )
-                
-                # Chart of all jobs
-                st.markdown("### ALL PROFESSIONS RANKED")
-                
-                # Sort by risk
-                sorted_risks = sorted(job_risks, key=lambda x: x["risk"], reverse=True)
-                
-                # Create bar chart
-                import plotly.graph_objects as go
-                
-                colors = [
-                    COLORS['primary_red'] if r["risk"] > 60 
-                    else COLORS['warning_orange'] if r["risk"] > 35 
-                    else COLORS['success_green'] 
-                    for r in sorted_risks
-                ]
-                
-                fig = go.Figure(data=[
-                    go.Bar(
-                        x=[r["risk"] for r in sorted_risks],
-                        y=[r["job"] for r in sorted_risks],
-                        orientation='h',
-                        marker=dict(color=colors, line=dict(color='#000000', width=2)),
-                        text=[f'{r["risk"]:.1f}%' for r in sorted_risks],
-                        textposition='outside',
-                    )
-                ])
-                
-                fig.update_layout(
-                    title="Automation Risk by Profession",
-                    xaxis_title="Automation Risk (%)",
-                    yaxis_title="",
-                    height=1200,
-                    showlegend=False,
-                    plot_bgcolor=COLORS['bg_primary'],
-                    paper_bgcolor=COLORS['bg_panel'],
-                    font=dict(family=FONTS['primary'], size=11, color=COLORS['text_primary']),
-                    title_font=dict(family=FONTS['heading'], size=20, color=COLORS['text_primary']),
-                    xaxis=dict(range=[0, 100], gridcolor=COLORS['border_heavy']),
-                    margin=dict(l=200, r=100, t=60, b=40)
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Two perspectives
-                st.markdown("---")
-                col_doom, col_hope = st.columns(2)
-                
-                with col_doom:
-                    st.markdown(f"""
-                    <div style="padding: 20px; background: {COLORS['primary_red']}; color: {COLORS['text_white']}; border: 4px solid {COLORS['border_heavy']}; box-shadow: 6px 6px 0px {COLORS['shadow']};">
-                        <h3 style="font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
-                            DOOM PERSPECTIVE
-                        </h3>
-                        <p style="font-family: {FONTS['primary']}; line-height: 1.6;">
-                            At {avg_risk:.1f}% average automation, we're accelerating toward mass job displacement. 
-                            {high_risk_count} professions face critical risk. Without intervention, economic chaos awaits.
-                        </p>
-                        <p style="font-family: {FONTS['primary']}; margin-top: 15px; font-weight: 700;">
-                            Path: Universal Basic Income or societal collapse.
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col_hope:
-                    st.markdown(f"""
-                    <div style="padding: 20px; background: {COLORS['success_green']}; color: {COLORS['text_white']}; border: 4px solid {COLORS['border_heavy']}; box-shadow: 6px 6px 0px {COLORS['shadow']};">
-                        <h3 style="font-family: {FONTS['heading']}; text-transform: uppercase; margin-bottom: 15px;">
-                            OPTIMIST PERSPECTIVE
-                        </h3>
-                        <p style="font-family: {FONTS['primary']}; line-height: 1.6;">
-                            {low_risk_count} professions remain highly human-centric. Automation frees us from drudgery. 
-                            We're headed for permanent vacation - if we plan wisely.
-                        </p>
-                        <p style="font-family: {FONTS['primary']}; margin-top: 15px; font-weight: 700;">
-                            Path: Renaissance of creativity, care, and meaning.
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Key insights
-                st.markdown("### KEY INSIGHTS")
-                
-                # Most/least automated
-                most_automated = max(job_risks, key=lambda x: x["risk"])
-                least_automated = min(job_risks, key=lambda x: x["risk"])
-                
-                insight_col1, insight_col2 = st.columns(2)
-                
-                with insight_col1:
-                    st.markdown(f"""
-                    **Most Automated Job:**  
-                    {most_automated['job']} at {most_automated['risk']:.1f}%
-                    
-                    **Pattern:** Repetitive, data-heavy, or physical labor jobs face highest risk.
-                    """)
-                
-                with insight_col2:
-                    st.markdown(f"""
-                    **Safest Job:**  
-                    {least_automated['job']} at {least_automated['risk']:.1f}%
-                    
-                    **Pattern:** Human touch, creativity, and empathy are hardest to automate.
-                    """)
-                
-                # Trend projection
-                st.markdown("### WHAT THIS MEANS")
-                
+            
+            # Key insights
+            st.markdown("### KEY INSIGHTS")
+            
+            # Most/least automated
+            most_automated = max(job_risks, key=lambda x: x["risk"])
+            least_automated = min(job_risks, key=lambda x: x["risk"])
+            
+            insight_col1, insight_col2 = st.columns(2)
+            
+            with insight_col1:
                 st.markdown(f"""
-                With **{avg_risk:.1f}% average automation risk**, we're at a critical juncture:
-                
-                **The Math:**
-                - {high_risk_count} professions ({high_risk_count/len(job_risks)*100:.0f}%) are in the danger zone
-                - {low_risk_count} professions ({low_risk_count/len(job_risks)*100:.0f}%) remain relatively safe
-                - The gap is widening - automation doesn't impact everyone equally
+                **Most Automated Job:**  
+                {most_automated['job']} at {most_automated['risk']:.1f}%
                 
-                **Two Futures:**
-                
-                1. **Dystopia:** Mass unemployment, wealth concentration, social unrest
-                2. **Utopia:** Universal Basic Income, creative renaissance, focus on human connection
-                
-                **The Choice:** How we handle this transition determines which future we get.
-                
-                **What You Can Do:**
-                - If your job is high risk: Start retraining NOW (see RETRAIN ME tab)
-                - If your job is safe: Help others transition (teach, mentor, advocate)
-                - Everyone: Support UBI policies and safety net expansion
+                **Pattern:** Repetitive, data-heavy, or physical labor jobs face highest risk.
                 """)
+            
+            with insight_col2:
+                st.markdown(f"""
+                **Safest Job:**  
+                {least_automated['job']} at {least_automated['risk']:.1f}%
                 
+                **Pattern:** Human touch, creativity, and empathy are hardest to automate.
+                """)
+            
+            # Trend projection
+            st.markdown("### WHAT THIS MEANS")
+            
+            st.markdown(f"""
+            With **{avg_risk:.1f}% average automation risk**, we're at a critical juncture:
+            
+            **The Math:**
+            - {high_risk_count} professions ({high_risk_count/len(job_risks)*100:.0f}%) are in the danger zone
+            - {low_risk_count} professions ({low_risk_count/len(job_risks)*100:.0f}%) remain relatively safe
+            - The gap is widening - automation doesn't impact everyone equally
+            
+            **Two Futures:**
+            
+            1. **Dystopia:** Mass unemployment, wealth concentration, social unrest
+            2. **Utopia:** Universal Basic Income, creative renaissance, focus on human connection
+            
+            **The Choice:** How we handle this transition determines which future we get.
+            
+            **What You Can Do:**
+            - If your job is high risk: Start retraining NOW (see RETRAIN ME tab)
+            - If your job is safe: Help others transition (teach, mentor, advocate)
+            - Everyone: Support UBI policies and safety net expansion
+            """)
+            
     except Exception as e:
         st.error("Unable to load Humanity Index data. Backend may be unavailable.")
         st.info(f"Error: {str(e)}")
 
+    # Breakdown by SOC occupation group, aggregated by the backend
+    st.markdown("---")
+    st.markdown("### DOOM BY OCCUPATION GROUP")
+
+    try:
+        groups = sorted(api_client.fetch_groups("major"), key=lambda g: g["weighted_risk"], reverse=True)
+
+        group_colors = [TIER_COLORS[get_risk_tier(g["weighted_risk"])] for g in groups]
+        group_fig = go.Figure(data=[
+            go.Bar(
+                x=[g["weighted_risk"] for g in groups],
+                y=[g["name"] or g["code"] for g in groups],
+                orientation='h',
+                marker=dict(color=group_colors, line=dict(color='#000000', width=2)),
+                text=[f'{g["weighted_risk"]:.1f}% ({g["job_count"]} jobs)' for g in groups],
+                textposition='outside',
+            )
+        ])
+        group_fig.update_layout(
+            title="Automation Risk by Occupation Group",
+            xaxis_title="Automation Risk (%)",
+            yaxis_title="",
+            height=max(300, 40 * len(groups)),
+            showlegend=False,
+            plot_bgcolor=COLORS['bg_primary'],
+            paper_bgcolor=COLORS['bg_panel'],
+            font=dict(family=FONTS['primary'], size=11, color=COLORS['text_primary']),
+            title_font=dict(family=FONTS['heading'], size=20, color=COLORS['text_primary']),
+            xaxis=dict(range=[0, 100], gridcolor=COLORS['border_heavy']),
+            yaxis=dict(autorange="reversed"),
+            margin=dict(l=300, r=120, t=60, b=40)
+        )
+        st.plotly_chart(group_fig, use_container_width=True)
+
+        # Drill down into one major group
+        group_names = {g["code"]: g["name"] or g["code"] for g in groups}
+        selected_code = st.selectbox(
+            "Drill into a group",
+            options=list(group_names),
+            format_func=lambda code: group_names[code],
+            key="group_drilldown"
+        )
+        if selected_code:
+            detail = api_client.fetch_group(selected_code)
+            col_mean, col_threats = st.columns([1, 2])
+            with col_mean:
+                st.metric("Average risk", f"{detail['mean_risk']:.1f}%")
+                st.caption(
+                    f"High {detail['tier_counts']['high']} / Medium {detail['tier_counts']['medium']} / "
+                    f"Low {detail['tier_counts']['low']}"
+                )
+            with col_threats:
+                st.markdown("**Biggest threats:** " + (", ".join(detail["top_threats"]) or "None listed"))
+                st.markdown(
+                    "**Subgroups:** " + ", ".join(
+                        f"{child['code']} ({child['mean_risk']:.1f}%, {child['job_count']} jobs)"
+                        for child in detail["children"]
+                    )
+                )
+            st.dataframe(
+                [{"Job": job["job_title"], "Risk (%)": job["risk_score"], "Tier": job["tier"].upper()} for job in detail["jobs"]],
+                use_container_width=True,
+                hide_index=True
+            )
+    except requests.exceptions.RequestException:
+        st.info("Occupation group breakdown is unavailable right now.")
+
+    # Catalog explorer: filtered analyses streamed line by line
+    st.markdown("---")
+    st.markdown("### EXPLORE THE CATALOG")
+
+    col_range, col_tier, col_onet = st.columns([2, 1, 1])
+    with col_range:
+        risk_range = st.slider("Risk range (%)", 0, 100, (0, 100), key="stream_risk_range")
+    with col_tier:
+        tier_choice = st.selectbox("Tier", ["All", "High", "Medium", "Low"], key="stream_tier")
+    with col_onet:
+        onet_prefix = st.text_input("O*NET code prefix", placeholder="e.g. 15-", key="stream_onet")
+
+    if st.button("STREAM ANALYSES", key="stream_btn"):
+        filters = {"min_risk": risk_range[0], "max_risk": risk_range[1], "onet_prefix": onet_prefix.strip()}
+        if tier_choice != "All":
+            filters["tier"] = tier_choice.lower()
+
+        status = st.empty()
+        table = st.empty()
+        rows = []
+        lines = []
+        try:
+            for analysis in api_client.stream_analyses(filters):
+                lines.append(json.dumps(analysis))
+                rows.append({
+                    "Job": analysis["job_title"],
+                    "Risk (%)": analysis["risk_score"],
+                    "Confidence": analysis["confidence"],
+                    "Top Threat": analysis["tech_drivers"][0] if analysis["tech_drivers"] else "",
+                    "Safest Pivot": analysis["safer_roles"][0]["title"] if analysis["safer_roles"] else ""
+                })
+                # Redraw every few rows so long streams stay cheap to render
+                if len(rows) % 10 == 1:
+                    status.markdown(f"Received {len(rows)} analyses...")
+                    table.dataframe(rows, use_container_width=True, hide_index=True)
+        except requests.exceptions.RequestException as e:
+            st.error(f"Stream interrupted after {len(rows)} analyses: {str(e)}")
+
+        status.markdown(f"**{len(rows)} professions** match these filters")
+        if rows:
+            table.dataframe(rows, use_container_width=True, hide_index=True)
+            st.download_button(
+                "DOWNLOAD NDJSON",
+                data="\n".join(lines) + "\n",
+                file_name="job_doom_analyses.ndjson",
+                mime="application/x-ndjson"
+            )
+
 # Footer
 st.markdown("---")
 
@@ -0,0 +1,175 @@
+"""
+Backend API client for Job Doom Calculator frontend
+
+Every request goes through one pooled keep-alive Session, so reruns reuse
+TLS connections to the backend instead of opening new ones. Connection
+errors and 502/503/504 responses (a sleeping dyno waking up) are retried
+with exponential backoff. Catalog-derived responses are memoized with
+st.cache_data; /analyze is not, since its flavor text changes per request.
+
+Only a backend without /stats (it answers 404) gets the Humanity Doom Index
+rebuilt from one /analyze call per job; timeouts and 5xx from /stats do not
+fall back. Those calls fan out over a bounded thread pool, so the wait
+tracks the slowest call rather than the sum of all of them.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import API_URL, get_risk_tier
+
+# (connect, read) timeouts in seconds per endpoint
+TIMEOUTS = {
+    "jobs": (3.05, 5),
+    "suggest": (3.05, 3),
+    "analyze": (3.05, 15),
+    "skill_gap": (3.05, 5),
+    "stats": (3.05, 5),
+    "groups": (3.05, 5),
+    "stream": (3.05, 15),  # read timeout applies between lines, not to the whole stream
+}
+
+# How long cached catalog responses stay fresh, in seconds
+STATIC_TTL = 300
+
+# Concurrent /analyze calls during a fan-out; below the session's pool_maxsize
+FANOUT_WORKERS = 8
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Session shared by all reruns and users, with retries for cold starts"""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,  # 0.5s, 1s, 2s between attempts
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),  # /analyze is a read despite the POST
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _get_json(path: str, endpoint: str, params: Dict = None) -> Dict:
+    """GET a backend path and decode it, raising requests exceptions on failure"""
+    response = get_session().get(f"{API_URL}{path}", params=params, timeout=TIMEOUTS[endpoint])
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_jobs() -> List[str]:
+    """All job titles in the backend catalog"""
+    return _get_json("/jobs", "jobs").get("jobs", [])
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_suggestions(query: str, limit: int = 5) -> List[str]:
+    """Autocomplete matches for a partial job title"""
+    return _get_json("/suggest", "suggest", params={"q": query, "limit": limit}).get("suggestions", [])
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_skill_gap(current_role: str, target_role: str) -> Dict:
+    """Skill gap and retraining estimate between two jobs"""
+    return _get_json("/skill-gap", "skill_gap", params={"from": current_role, "to": target_role})
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_stats() -> Dict:
+    """Aggregate risk statistics for the whole catalog"""
+    return _get_json("/stats", "stats")
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_groups(level: str = "major") -> List[Dict]:
+    """Risk aggregates for every SOC occupation group at one level"""
+    return _get_json("/groups", "groups", params={"level": level}).get("groups", [])
+
+@st.cache_data(ttl=STATIC_TTL, show_spinner=False)
+def fetch_group(code: str) -> Dict:
+    """One occupation group with its subgroups and jobs"""
+    return _get_json(f"/groups/{code}", "groups")
+
+def analyze_job(job_title: str) -> requests.Response:
+    """POST /analyze; the caller handles 200/404/other status codes"""
+    return get_session().post(f"{API_URL}/analyze", json={"job_title": job_title}, timeout=TIMEOUTS["analyze"])
+
+def stream_analyses(filters: Dict = None) -> Iterator[Dict]:
+    """Yield analyses from /analyze/stream as each NDJSON line arrives"""
+    with get_session().get(
+        f"{API_URL}/analyze/stream", params=filters, stream=True, timeout=TIMEOUTS["stream"]
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                yield json.loads(line)
+
+@st.cache_resource(ttl=STATIC_TTL)
+def risk_score_cache() -> Dict[str, float]:
+    """Job title -> risk score from earlier fan-outs, kept across reruns"""
+    return {}
+
+def fetch_risk_score(job_title: str) -> Optional[float]:
+    """Risk score for one job via /analyze; None if the backend has no match"""
+    response = analyze_job(job_title)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()["risk_score"]
+
+def iter_risk_scores(job_titles: List[str]) -> Iterator[Tuple[str, Optional[float]]]:
+    """Yield (title, risk score) pairs as they arrive, cached ones first
+
+    Only for backends without /stats (404), one /analyze call per title.
+    Requests run on worker threads; results are yielded on the calling
+    thread, so callers can update Streamlit elements between them. Failed
+    calls yield None and are retried on the next rerun. Closing the generator
+    early cancels the calls not yet started.
+    """
+    cache = risk_score_cache()
+    pending = []
+    for title in job_titles:
+        if title in cache:
+            yield title, cache[title]
+        else:
+            pending.append(title)
+    if not pending:
+        return
+
+    pool = ThreadPoolExecutor(max_workers=min(FANOUT_WORKERS, len(pending)), thread_name_prefix="fanout")
+    try:
+        futures = {pool.submit(fetch_risk_score, title): title for title in pending}
+        for future in as_completed(futures):
+            title = futures[future]
+            try:
+                risk_score = future.result()
+            except (requests.exceptions.RequestException, KeyError, ValueError):
+                risk_score = None
+            if risk_score is not None:
+                cache[title] = risk_score
+            yield title, risk_score
+    finally:
+        # A consumer that stops early (e.g. a Streamlit rerun) must not wait
+        # for the queued calls; ones already in flight finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def summarize_risks(risk_scores: Dict[str, float]) -> Dict:
+    """Same shape as /stats, built from per-job risk scores"""
+    ranked = sorted(risk_scores.items(), key=lambda item: item[1], reverse=True)
+    tier_counts = {"high": 0, "medium": 0, "low": 0}
+    for _, risk_score in ranked:
+        tier_counts[get_risk_tier(risk_score)] += 1
+
+    return {
+        "job_count": len(ranked),
+        "average_risk": round(sum(risk_scores.values()) / len(ranked), 1) if ranked else 0.0,
+        "tier_counts": tier_counts,
+        "ranked_jobs": [
+            {"job_title": title, "risk_score": round(risk_score, 1), "tier": get_risk_tier(risk_score)}
+            for title, risk_score in ranked
+        ]
+    }
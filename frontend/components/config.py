@@ -6,6 +6,19 @@ import os
 # ===== CONFIGURATION =====
 API_URL = os.getenv("API_URL", "https://p-doomsday-backend-785eba1da668.herokuapp.com")
 
+# ===== RISK TIERS =====
+# Same thresholds as get_risk_tier in backend/app/data_loader.py
+HIGH_RISK_THRESHOLD = 60
+MEDIUM_RISK_THRESHOLD = 35
+
+def get_risk_tier(risk_score: float) -> str:
+    """Map a risk score to its doom tier"""
+    if risk_score > HIGH_RISK_THRESHOLD:
+        return "high"
+    elif risk_score > MEDIUM_RISK_THRESHOLD:
+        return "medium"
+    return "low"
+
 # ===== UI ELEMENTS =====
 # Text-based visual markers
 UI_ELEMENTS = {
@@ -42,6 +55,13 @@ COLORS = {
     'shadow': 'rgba(0, 0, 0, 0.3)',
 }
 
+# Chart color per doom tier
+TIER_COLORS = {
+    'high': COLORS['primary_red'],
+    'medium': COLORS['warning_orange'],
+    'low': COLORS['success_green'],
+}
+
 FONTS = {
     'primary': "'Courier New', 'Courier', 'Lucida Console', monospace",
     'heading': "'Impact', 'Arial Black', sans-serif",